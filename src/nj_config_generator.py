@@ -0,0 +1,192 @@
+#!/usr/bin/python
+# MIT License
+# 
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+# 
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+import sys
+import argparse
+import os.path
+import json
+import csv
+import re
+from collections import OrderedDict
+from nj_gen_elec_parser import CONST_RACES, process_header_line
+
+CONST_COUNTIES = [ 'Atlantic', 'Bergen', 'Burlington', 'Camden', 'Cape May', 'Cumberland', 'Essex',
+                   'Gloucester', 'Hudson', 'Hunterdon', 'Mercer', 'Middlesex', 'Monmouth', 'Morris',
+                   'Ocean', 'Passaic', 'Salem', 'Somerset', 'Sussex', 'Union', 'Warren' ]
+
+CONST_OFFICES = { 'president': 'President',
+                  'us_house': 'U.S. House',
+                  'us_senate': 'U.S. Senate',
+                  'nj_senate': 'State Senate',
+                  'nj_assembly': 'General Assembly',
+                  'governor': 'Governor' }
+
+# Tried in order against the normalized file name; the first match wins.
+# A legislative file naming both the assembly and the senate (or just the
+# legislative district) holds both races side by side.
+CONST_RACE_PATTERNS = [ ('president', re.compile(r'presiden')),
+                        ('governor', re.compile(r'governor')),
+                        ('us_senate', re.compile(r'us-senate')),
+                        ('us_house', re.compile(r'(^|-)(us-)?hor(-|\d)|house|congress')),
+                        ('legislature', re.compile(r'assembly.*senate|senate.*assembly|leg-district')),
+                        ('nj_assembly', re.compile(r'assembly')),
+                        ('nj_senate', re.compile(r'senate')) ]
+
+CONST_DISTRICT_PATTERN = re.compile(r'district-?0*(\d+)|(\d+)(?:st|nd|rd|th)-l(?:eg|d)\b|(?:house|senate|assembly|hor)-?0*(\d+)')
+
+def main():
+
+    args = handle_arguments()
+    if not os.path.isdir(args.input_directory):
+        sys.exit('ERROR: Input directory ' + args.input_directory + ' does not exist')
+
+    config = generate_config(args.input_directory, args.output_directory, args.output_file, args.county)
+    if args.config is None:
+        json.dump(config, sys.stdout, indent=4)
+        print ''
+    else:
+        with open(args.config, 'w') as config_file:
+            json.dump(config, config_file, indent=4)
+
+def handle_arguments():
+    arg_parser = argparse.ArgumentParser(description='Generate an nj_gen_elec_parser.py config from a directory of tabula files')
+    arg_parser.add_argument('input_directory', help='directory holding the tabula CSV files')
+    arg_parser.add_argument('--output-directory', dest='output_directory', default='.', help='output_directory of the generated config')
+    arg_parser.add_argument('--output-file', dest='output_file', required=True, help='output_file of the generated config')
+    arg_parser.add_argument('--county', dest='county', default='*', help='county of files whose name does not give one (default: every county)')
+    arg_parser.add_argument('--config', dest='config', help='where to write the config (default: standard output)')
+    return arg_parser.parse_args()
+
+def warn(p_message):
+    print >> sys.stderr, ' WARNING: ' + p_message
+
+def normalize_file_name(p_file_name):
+    return re.sub(r'[\s_]+', '-', os.path.splitext(p_file_name)[0].lower())
+
+def find_race(p_name):
+    for race, pattern in CONST_RACE_PATTERNS:
+        if pattern.search(p_name):
+            return race
+    return None
+
+def find_district(p_name):
+    match = CONST_DISTRICT_PATTERN.search(p_name)
+    if match is None:
+        return ''
+    return [group for group in match.groups() if group is not None][0]
+
+def find_county(p_name, p_default_county):
+    for county in CONST_COUNTIES:
+        for slug in [county.lower().replace(' ', '-'), county.lower().replace(' ', '')]:
+            if re.search(r'(^|-)' + slug + r'(-|$)', p_name):
+                return county
+    return p_default_county
+
+def read_candidates(p_input_file):
+    candidateList = []
+    partyList = []
+    with open(p_input_file, 'rb') as csvfile:
+        for line in csv.reader(csvfile, delimiter=',', quotechar='"'):
+            process_header_line(candidateList, partyList, line, None)
+            break
+    return candidateList, partyList
+
+def get_columns_string(p_first, p_last):
+    return ','.join(str(i) for i in range(p_first, p_last + 1))
+
+# A legislative file lists the senate candidates, one per party, before the
+# assembly candidates. The senate block is taken to end where a party first
+# repeats, which should be checked by hand when a minor party only runs for
+# the assembly.
+def split_legislature_columns(p_partyList):
+    senate_count = 0
+    while senate_count < len(p_partyList) - 1 and p_partyList[senate_count] not in p_partyList[:senate_count]:
+        senate_count += 1
+    return senate_count
+
+def build_entry(p_race, p_file_name, p_county, p_district, p_columns):
+    return OrderedDict([ ('office', CONST_OFFICES[p_race]),
+                         ('file', p_file_name),
+                         ('county', p_county),
+                         ('district', p_district),
+                         ('columns', p_columns) ])
+
+# Returns the (race, entry) pairs for one tabula file, or nothing when its
+# race cannot be told from the file name.
+def build_file_entries(p_input_directory, p_file_name, p_default_county):
+    name = normalize_file_name(p_file_name)
+    race = find_race(name)
+    if race is None:
+        warn('cannot tell the race of ' + p_file_name + ', skipping it')
+        return []
+    district = find_district(name)
+    county = find_county(name, p_default_county)
+
+    candidateList, partyList = read_candidates(os.path.join(p_input_directory, p_file_name))
+    if len(candidateList) == 0:
+        # Without candidates the senate and assembly columns of a legislative
+        # file cannot be told apart, and '*' for both would count every vote
+        # twice.
+        if race == 'legislature':
+            warn('no candidates in the header of ' + p_file_name + ' to split into senate and assembly columns, skipping it')
+            return []
+        warn('no candidates in the header of ' + p_file_name + ', using every column')
+        return [(race, build_entry(race, p_file_name, county, district, '*'))]
+
+    if race == 'legislature':
+        # A single candidate cannot be both a senate and an assembly column.
+        if len(candidateList) < 2:
+            warn('only one candidate in the header of ' + p_file_name + ' to split into senate and assembly columns, skipping it')
+            return []
+        senate_count = split_legislature_columns(partyList)
+        warn(p_file_name + ': taking ' + ', '.join(candidateList[:senate_count]) + ' as the senate candidates')
+        return [('nj_senate', build_entry('nj_senate', p_file_name, county, district,
+                                          get_columns_string(1, senate_count))),
+                ('nj_assembly', build_entry('nj_assembly', p_file_name, county, district,
+                                            get_columns_string(senate_count + 1, len(candidateList))))]
+    return [(race, build_entry(race, p_file_name, county, district, get_columns_string(1, len(candidateList))))]
+
+def entry_sort_key(p_entry):
+    district = 0
+    if p_entry['district'] != '':
+        district = int(p_entry['district'])
+    return (district, p_entry['county'], p_entry['file'])
+
+# Reads the header of every CSV file in the input directory once and builds
+# a config nj_gen_elec_parser.py can run as it is.
+def generate_config(p_input_directory, p_output_directory, p_output_file, p_default_county='*'):
+    race_entries = dict((race, []) for race in CONST_RACES)
+    for file_name in sorted(os.listdir(p_input_directory)):
+        if file_name.lower().endswith('.csv'):
+            for race, entry in build_file_entries(p_input_directory, file_name, p_default_county):
+                race_entries[race].append(entry)
+
+    config = OrderedDict([ ('output_directory', p_output_directory),
+                           ('output_file', p_output_file) ])
+    for race in CONST_RACES:
+        if len(race_entries[race]) > 0:
+            config[race] = OrderedDict([ ('input_directory', p_input_directory),
+                                         ('input_files', sorted(race_entries[race], key=entry_sort_key)) ])
+    return config
+
+if __name__ == '__main__':
+    main()
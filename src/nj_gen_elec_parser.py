@@ -25,46 +25,79 @@ import argparse
 import os.path
 import json
 import csv
+import hashlib
+import multiprocessing
+from cStringIO import StringIO
 
-arg_parser = argparse.ArgumentParser(description='Parse New Jersey Count data.')
-arg_parser.add_argument('configfile', type=str, nargs=1) 
-arg_parser.add_argument('--muni', help='run in municipality mode', action='store_true')
-arg_parser.add_argument('--prec', help='run in precinct mode', action='store_true')
-args = arg_parser.parse_args()
+CONST_MODES = ['county', 'muni', 'prec']
 
-def validateArgs( p_args ):
-    if args.muni:
+CONST_MODE_FILE_SUFFIXES = { 'county': '',
+                             'muni': '__municipal',
+                             'prec': '__precinct' }
+
+CONST_RACES = ['president', 'us_house', 'us_senate', 'nj_senate', 'nj_assembly', 'governor']
+
+# Bump when a change to the parsing code changes its output, so fragments
+# cached by an older version are not reused.
+CONST_FRAGMENT_VERSION = '1'
+
+def handle_arguments():
+    arg_parser = argparse.ArgumentParser(description='Parse New Jersey Count data.')
+    arg_parser.add_argument('configfile', type=str, nargs='+', help='one or more JSON config files, processed in order')
+    arg_parser.add_argument('--muni', help='run in municipality mode', action='store_true')
+    arg_parser.add_argument('--prec', help='run in precinct mode', action='store_true')
+    arg_parser.add_argument('--all', help='write county, municipality and precinct files in one run', action='store_true')
+    arg_parser.add_argument('--jobs', '-j', type=int, default=1, help='number of input files to parse at once')
+    arg_parser.add_argument('--cache-dir', dest='cache_dir', help='reuse the output of input files that have not changed since they were cached here')
+    return arg_parser.parse_args()
+
+def get_modes( p_args ):
+    if p_args.all:
+        return CONST_MODES
+    elif p_args.muni:
+        return ['muni']
+    elif p_args.prec:
+        return ['prec']
+    return ['county']
+
+def validateArgs( p_modes, p_config_file ):
+    if 'muni' in p_modes:
         print ' ***** Running in Municipality Mode *****'
-    if args.prec:
+    if 'prec' in p_modes:
         print ' ***** Running in Precinct Mode *****'
-    if os.path.isfile(args.configfile[0]) != True:
-        sys.exit('ERROR: Config File ' + args.configfile[0] + ' does not exist')
+    if os.path.isfile(p_config_file) != True:
+        sys.exit('ERROR: Config File ' + p_config_file + ' does not exist')
     else:
-        print ' Using config file ' + args.configfile[0]
+        print ' Using config file ' + p_config_file
     return
 
-def readJsonConfig ( p_args ):
-    with open(p_args.configfile[0]) as config_file:
+def readJsonConfig ( p_config_file ):
+    with open(p_config_file) as config_file:
         config_data = json.load(config_file)
     return config_data
 
-def openOutputFile( p_config ):
-    full_output_file = os.path.join(p_config['output_directory'], p_config['output_file'])
+# With more than one mode, the municipality and precinct files get a level
+# suffix so they don't overwrite the county file.
+def get_output_file_name( p_config, p_mode, p_modes ):
+    output_file = p_config['output_file']
+    if len(p_modes) > 1:
+        name, extension = os.path.splitext(output_file)
+        output_file = name + CONST_MODE_FILE_SUFFIXES[p_mode] + extension
+    return os.path.join(p_config['output_directory'], output_file)
+
+def openOutputFile( full_output_file ):
     try:
         f = open( full_output_file, 'w') 
-        writer = csv.writer(f, quoting=csv.QUOTE_MINIMAL)
     except:
         sys.exit('ERROR: Could not open output file: ' + full_output_file)
-    return writer
+    return f
 
-def print_header( p_outfile):
-    if args.muni:
-        p_outfile.writerow( ('county','municipality','office','district','party','candidate','votes') )
-    elif args.prec:
-        p_outfile.writerow( ('county','precinct','office','district','party','candidate','votes') )
-    else:
-        p_outfile.writerow( ('county','office','district','party','candidate','votes') )
-    return
+def get_header( p_mode ):
+    if p_mode == 'muni':
+        return ('county','municipality','office','district','party','candidate','votes')
+    elif p_mode == 'prec':
+        return ('county','precinct','office','district','party','candidate','votes')
+    return ('county','office','district','party','candidate','votes')
 
 def doesJsonKeyExist( p_config, p_key ):
     key_exists = True
@@ -105,66 +138,62 @@ def populate_candidate_party_lists( p_candidateList, p_partyList, p_header):
         p_partyList.append(value1)
     return
 
-def print_county_totals( p_candidateList, p_partyList, p_line, p_outfile, p_config, p_county_name):
-    valid_column = p_config['columns'].split(",")
-    for i in range(len(p_line)):
-        print_value=False
-        if i > 0:
-            if p_config['columns'] == '*':
-                print_value=True
-            else:   
-                if str(i) in valid_column:
-                    print_value=True
-        if print_value == True:
-            p_outfile.writerow((p_county_name, 
-                                p_config['office'],
-                                p_config['district'],
-                                p_partyList[i-1], 
-                                p_candidateList[i-1], 
-                                clean_text_values(p_line[i]) 
-                               ))
-    return
+# The columns of one input file that are written out, compiled once from its
+# config entry and header line. For each line length it keeps the selected
+# column indexes, in column order, with the party and candidate of each.
+class ColumnPlan:
 
-def print_muni_totals( p_candidateList, p_partyList, p_line, p_outfile, p_config, p_county_name):
-    valid_column = p_config['columns'].split(",")
-    for i in range(len(p_line)):
-        print_value=False
-        if i > 0:
-            if p_config['columns'] == '*':
-                print_value=True
-            else:   
-                if str(i) in valid_column:
-                    print_value=True
-        if print_value == True:
-            p_outfile.writerow((p_county_name,
-                                p_line[0],
-                                p_config['office'],
-                                p_config['district'],
-                                p_partyList[i-1], 
-                                p_candidateList[i-1], 
-                                clean_text_values(p_line[i]) 
-                               ))
-    return
+    def __init__(self, p_config, p_candidateList, p_partyList):
+        self.office = p_config['office']
+        self.district = p_config['district']
+        self.selected_columns = None
+        if p_config['columns'] != '*':
+            self.selected_columns = frozenset(int(column) for column in p_config['columns'].split(",")
+                                              if column.isdigit() and str(int(column)) == column)
+        self.party_candidates = zip(p_partyList, p_candidateList)
+        self.line_columns = {}
+
+    def get_columns(self, p_line_length):
+        columns = self.line_columns.get(p_line_length)
+        if columns is None:
+            columns = []
+            for i in range(1, p_line_length):
+                if self.selected_columns is None or i in self.selected_columns:
+                    party, candidate = self.party_candidates[i-1]
+                    columns.append((i, party, candidate))
+            columns = tuple(columns)
+            self.line_columns[p_line_length] = columns
+        return columns
+
+def get_county_totals( p_plan, p_line, p_county_name):
+    return [(p_county_name, p_plan.office, p_plan.district, party, candidate, clean_text_values(p_line[i]))
+            for i, party, candidate in p_plan.get_columns(len(p_line))]
+
+def get_muni_totals( p_plan, p_line, p_county_name):
+    return [(p_county_name, p_line[0], p_plan.office, p_plan.district, party, candidate, clean_text_values(p_line[i]))
+            for i, party, candidate in p_plan.get_columns(len(p_line))]
 
 def process_header_line( p_candidateList, p_partyList, p_line, p_config):
     for header in p_line:
         populate_candidate_party_lists(p_candidateList, p_partyList, header)
     return
 
-def process_county_line(p_candidateList, p_partyList, p_line, p_outfile, p_config, p_county_name):
+def process_county_line(p_plan, p_line, p_config, p_county_name):
     search_text = 'TOTAL'
     if p_config['county'] == '*':
         search_text = 'COUNTY TOTAL'
     if search_text in p_line[0].upper():
-        print_county_totals(p_candidateList, p_partyList, p_line, p_outfile, p_config, p_county_name)
+        return get_county_totals(p_plan, p_line, p_county_name)
     else:
         search_text = p_county_name.upper() + ' TOTALS'
         if search_text in p_line[0].upper():
-            print_county_totals(p_candidateList, p_partyList, p_line, p_outfile, p_config, p_county_name)
+            return get_county_totals(p_plan, p_line, p_county_name)
+    return []
 
-def process_muni_line(p_candidateList, p_partyList, p_line, p_outfile, p_config, p_county_name):
+def process_muni_line(p_plan, p_line, p_config, p_county_name):
     if "TOTAL" not in p_line[0].upper() and "COUNTY" not in p_line[0].upper():
-        print_muni_totals(p_candidateList, p_partyList, p_line, p_outfile, p_config, p_county_name)
+        return get_muni_totals(p_plan, p_line, p_county_name)
+    return []
 
 def extract_county_name(p_line, p_config, p_county_name):
     return_value = p_county_name
@@ -175,24 +204,22 @@ def extract_county_name(p_line, p_config, p_county_name):
         return_value = p_config['county']
     return return_value
 
-def process_data_line( p_candidateList, p_partyList, p_line, p_outfile, p_config, county_name):
-    if args.muni:
-        process_muni_line(p_candidateList, p_partyList, p_line, p_outfile, p_config, county_name)
-    elif args.prec:
-        process_muni_line(p_candidateList, p_partyList, p_line, p_outfile, p_config, county_name)
+def process_data_line( p_plan, p_line, p_config, county_name, p_mode):
+    if p_mode == 'muni':
+        return process_muni_line(p_plan, p_line, p_config, county_name)
+    elif p_mode == 'prec':
+        return process_muni_line(p_plan, p_line, p_config, county_name)
     else:
-        process_county_line(p_candidateList, p_partyList, p_line, p_outfile, p_config, county_name)
-    return
+        return process_county_line(p_plan, p_line, p_config, county_name)
 
-def process_single_file(p_config, p_outfile, p_infile):
+def process_single_file(p_config, p_infile, p_modes):
     counter = 0
     candidateList = []
     partyList = []
+    plan = None
     county_name = 'unknown'
     #print 'Processing ' + p_infile
-    if os.path.isfile(p_infile) != True:
-        print 'ERROR: Input File ' + p_infile + ' does not exist'
-    else:
+    if os.path.isfile(p_infile):
         with open(p_infile, 'rb') as csvfile:
             csvreader = csv.reader(csvfile, delimiter=',', quotechar='"')
             for line in csvreader:
@@ -200,41 +227,228 @@ def process_single_file(p_config, p_outfile, p_infile):
                 counter = counter + 1
                 if counter == 1:
                     process_header_line(candidateList, partyList, line, p_config)
+                    plan = ColumnPlan(p_config, candidateList, partyList)
                 else:
                     county_name = extract_county_name(line, p_config, county_name)
-                    process_data_line(candidateList, partyList, line, p_outfile, p_config, county_name)
-    return
+                    for mode in p_modes:
+                        for row in process_data_line(plan, line, p_config, county_name, mode):
+                            yield (mode, row)
 
-def process_input_files(p_config, p_outfile, p_config_key):
-    input_path = p_config[p_config_key]['input_directory']
-    race_data = p_config[p_config_key]
-    for input_file in race_data['input_files']:
-        full_input_file = os.path.join(input_path, input_file["file"])
-        process_single_file(input_file, p_outfile, full_input_file)
-    return
+def iter_input_file(p_task):
+    input_file, full_input_file, p_modes = p_task
+    return process_single_file(input_file, full_input_file, p_modes)
 
-def process_single_race( p_config, p_outfile, p_config_key):
-    if doesJsonKeyExist(p_config, p_config_key):
-        print ' Found data for ' + p_config_key + '. Processing this race.'
-        process_input_files(p_config, p_outfile, p_config_key)
-    else:
-        print ' Config file doesn\'t contain data for ' + p_config_key + '. Skipping this race.'
-    return
+# Runs in a worker process and returns every (mode, row) pair of one file.
+def parse_input_file(p_task):
+    return list(iter_input_file(p_task))
 
-def process_config_data(p_config, p_outfile):
-    print_header(p_outfile)
-    process_single_race(p_config, p_outfile, 'president')
-    process_single_race(p_config, p_outfile, 'us_house')
-    process_single_race(p_config, p_outfile, 'us_senate')
-    process_single_race(p_config, p_outfile, 'nj_senate')
-    process_single_race(p_config, p_outfile, 'nj_assembly')
-    process_single_race(p_config, p_outfile, 'governor')
+# Runs in a worker process and returns the rows of one file already written
+# out as CSV, one (mode, text) pair per mode. Text is much cheaper to send
+# back to the parent process than the rows themselves.
+def render_input_file(p_task):
+    input_file, full_input_file, p_modes = p_task
+    buffers = dict((mode, StringIO()) for mode in p_modes)
+    writers = dict((mode, csv.writer(buffers[mode], quoting=csv.QUOTE_MINIMAL)) for mode in p_modes)
+    for mode, row in iter_input_file(p_task):
+        writers[mode].writerow(row)
+    return [(mode, buffers[mode].getvalue()) for mode in p_modes]
+
+# Keeps the CSV text written for each mode of an input file on disk, keyed
+# by a hash of the file contents, its config entry and the mode. A rerun only
+# has to parse the input files that changed.
+class FragmentCache:
+
+    def __init__(self, p_directory):
+        self.directory = p_directory
+        if not os.path.isdir(p_directory):
+            os.makedirs(p_directory)
+
+    def get_keys(self, p_input_file, p_full_input_file, p_modes):
+        content_hash = hashlib.sha1()
+        with open(p_full_input_file, 'rb') as input_file:
+            for chunk in iter(lambda: input_file.read(65536), ''):
+                content_hash.update(chunk)
+        entry = json.dumps(p_input_file, sort_keys=True)
+        keys = {}
+        for mode in p_modes:
+            key_hash = hashlib.sha1()
+            for value in [CONST_FRAGMENT_VERSION, content_hash.hexdigest(), entry, mode]:
+                key_hash.update(value + '\n')
+            keys[mode] = key_hash.hexdigest()
+        return keys
+
+    def get_fragment_file(self, p_key):
+        return os.path.join(self.directory, p_key + '.csv')
+
+    # Returns the (mode, text) pairs for the keys, or None unless every
+    # mode has been cached.
+    def load(self, p_keys, p_modes):
+        mode_texts = []
+        for mode in p_modes:
+            fragment_file = self.get_fragment_file(p_keys[mode])
+            if not os.path.isfile(fragment_file):
+                return None
+            with open(fragment_file, 'rb') as f:
+                mode_texts.append((mode, f.read()))
+        return mode_texts
+
+    # Writes each fragment under a temporary name first, so an interrupted
+    # run never leaves a partial fragment behind.
+    def save(self, p_keys, p_mode_texts):
+        for mode, text in p_mode_texts:
+            fragment_file = self.get_fragment_file(p_keys[mode])
+            with open(fragment_file + '.tmp', 'wb') as f:
+                f.write(text)
+            os.rename(fragment_file + '.tmp', fragment_file)
+
+# The races of a config in the order they are written out: the known races
+# of CONST_RACES first, then any other race block of the config (a key
+# holding input_files) by name, so new offices don't need a code change.
+def get_race_names(p_config):
+    other_races = [key for key in p_config if key not in CONST_RACES and
+                   isinstance(p_config[key], dict) and doesJsonKeyExist(p_config[key], 'input_files')]
+    return CONST_RACES + sorted(other_races)
+
+def list_input_files(p_config):
+    for race in get_race_names(p_config):
+        if doesJsonKeyExist(p_config, race):
+            input_path = p_config[race]['input_directory']
+            for index, input_file in enumerate(p_config[race]['input_files']):
+                yield (race, index, input_file, os.path.join(input_path, input_file["file"]))
+
+# Looks up every existing input file of the config in the cache, keyed by
+# race and position in the config. Returns the cache keys of the files and
+# the fragments that were found.
+def load_cached_input_files(p_cache, p_config, p_modes):
+    keys = {}
+    cached = {}
+    for race, index, input_file, full_input_file in list_input_files(p_config):
+        if os.path.isfile(full_input_file):
+            keys[(race, index)] = p_cache.get_keys(input_file, full_input_file, p_modes)
+            mode_texts = p_cache.load(keys[(race, index)], p_modes)
+            if mode_texts is not None:
+                cached[(race, index)] = mode_texts
+    return keys, cached
+
+# Hands every existing input file of the config that is not already cached
+# to the pool, keyed by race and position in the config. Missing files are
+# left to the parent process so their errors are printed in config order.
+def start_input_files(p_pool, p_config, p_modes, p_process_file, p_cached):
+    pending = {}
+    for race, index, input_file, full_input_file in list_input_files(p_config):
+        if os.path.isfile(full_input_file) and (race, index) not in p_cached:
+            pending[(race, index)] = p_pool.apply_async(p_process_file, ((input_file, full_input_file, p_modes),))
+    return pending
+
+# Walks the input files of every race in race order and yields what
+# p_process_file returns for each one. With p_jobs above 1 the files of all
+# races are processed together by a pool of worker processes, but results
+# still come out in race order, so the output is the same as a sequential
+# run. With a FragmentCache, p_process_file must return (mode, text) pairs; unchanged
+# files are read from the cache and the others are added to it. Missing
+# files are skipped. Progress and error messages go to p_report when one is
+# given.
+def process_input_files(p_config, p_modes, p_process_file, p_jobs=1, p_cache=None, p_report=None):
+    keys = {}
+    cached = {}
+    if p_cache is not None:
+        keys, cached = load_cached_input_files(p_cache, p_config, p_modes)
+    pool = None
+    pending = {}
+    if p_jobs > 1:
+        pool = multiprocessing.Pool(p_jobs)
+        pending = start_input_files(pool, p_config, p_modes, p_process_file, cached)
+    try:
+        for race in get_race_names(p_config):
+            if doesJsonKeyExist(p_config, race):
+                if p_report is not None:
+                    p_report(' Found data for ' + race + '. Processing this race.')
+                input_path = p_config[race]['input_directory']
+                for index, input_file in enumerate(p_config[race]['input_files']):
+                    full_input_file = os.path.join(input_path, input_file["file"])
+                    if (race, index) in cached:
+                        yield cached[(race, index)]
+                        continue
+                    if not os.path.isfile(full_input_file):
+                        if p_report is not None:
+                            p_report('ERROR: Input File ' + full_input_file + ' does not exist')
+                        continue
+                    if (race, index) in pending:
+                        result = pending[(race, index)].get()
+                    else:
+                        result = p_process_file((input_file, full_input_file, p_modes))
+                    if (race, index) in keys:
+                        p_cache.save(keys[(race, index)], result)
+                    yield result
+            else:
+                if p_report is not None:
+                    p_report(' Config file doesn\'t contain data for ' + race + '. Skipping this race.')
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+
+# Streams (mode, row) pairs for every race in an already loaded config,
+# reading each input file once for all of p_modes. The header row of each
+# mode comes first. With p_jobs above 1 the input files are parsed by a pool
+# of worker processes. Progress and error messages go to p_report when one
+# is given.
+def parse_config_levels(p_config, p_modes, p_jobs=1, p_report=None):
+    for mode in p_modes:
+        if mode not in CONST_MODES:
+            raise ValueError('Unknown mode: ' + str(mode))
+    for mode in p_modes:
+        yield (mode, get_header(mode))
+    process_file = iter_input_file
+    if p_jobs > 1:
+        process_file = parse_input_file
+    for mode_rows in process_input_files(p_config, p_modes, process_file, p_jobs, None, p_report):
+        for mode_row in mode_rows:
+            yield mode_row
+
+# Streams the rows for every race in an already loaded config, starting with
+# the header row. p_mode is one of CONST_MODES. Nothing is written to disk,
+# so callers can run several configs in one process.
+def parse_config(p_config, p_mode='county', p_jobs=1):
+    for mode, row in parse_config_levels(p_config, [p_mode], p_jobs):
+        yield row
+
+def report_progress(p_message):
+    print p_message
+
+def process_config_data(p_config, p_modes, p_jobs=1, p_cache=None):
+    out_files = {}
+    try:
+        for mode in p_modes:
+            out_files[mode] = openOutputFile(get_output_file_name(p_config, mode, p_modes))
+        if p_jobs > 1 or p_cache is not None:
+            for mode in p_modes:
+                csv.writer(out_files[mode], quoting=csv.QUOTE_MINIMAL).writerow(get_header(mode))
+            for mode_texts in process_input_files(p_config, p_modes, render_input_file, p_jobs, p_cache, report_progress):
+                for mode, text in mode_texts:
+                    out_files[mode].write(text)
+        else:
+            writers = dict((mode, csv.writer(out_files[mode], quoting=csv.QUOTE_MINIMAL)) for mode in p_modes)
+            for mode, row in parse_config_levels(p_config, p_modes, 1, report_progress):
+                writers[mode].writerow(row)
+    finally:
+        for out_file in out_files.values():
+            out_file.close()
     return
 
-validateArgs( args )
-config = readJsonConfig( args )
-out_file = openOutputFile(config)
-try:
-    process_config_data(config, out_file)
-except Exception as e:
-    print(e)
+def main():
+    args = handle_arguments()
+    modes = get_modes(args)
+    cache = None
+    if args.cache_dir is not None:
+        cache = FragmentCache(args.cache_dir)
+    for config_file in args.configfile:
+        validateArgs(modes, config_file)
+        config = readJsonConfig(config_file)
+        try:
+            process_config_data(config, modes, args.jobs, cache)
+        except Exception as e:
+            print(e)
+
+if __name__ == '__main__':
+    main()
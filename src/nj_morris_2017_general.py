@@ -25,13 +25,23 @@ import argparse
 import os.path
 import json
 import csv
+import multiprocessing
+from nj_parser_pool import *
 
 arg_parser = argparse.ArgumentParser(description='Parse New Jersey Count data.')
 arg_parser.add_argument('configfile', type=str, nargs=1) 
 arg_parser.add_argument('--muni', help='run in municipality mode', action='store_true')
+arg_parser.add_argument('--jobs', '-j', type=int, default=1, help='number of input files to parse at once')
 arg_parser.add_argument('--prec', help='run in precinct mode', action='store_true')
 args = arg_parser.parse_args()
 
+CONST_RACES = [ #'president',
+                #'us_house',
+                #'us_senate',
+                'nj_senate',
+                'nj_assembly',
+                'governor' ]
+
 def validateArgs( p_args ):
     if args.muni:
         print ' ***** Running in Municipality Mode *****'
@@ -52,7 +62,7 @@ def openOutputFile( p_config ):
     full_output_file = os.path.join(p_config['output_directory'], p_config['output_file'])
     try:
         f = open( full_output_file, 'w') 
-        writer = csv.writer(f, quoting=csv.QUOTE_MINIMAL)
+        writer = OutputWriter(f)
     except:
         sys.exit('ERROR: Could not open output file: ' + full_output_file)
     return writer
@@ -228,36 +238,45 @@ def process_single_file(p_config, p_outfile, p_infile):
                         process_data_line(candidateList, partyList, line, p_outfile, p_config, county_name, muni_name)
     return
 
-def process_input_files(p_config, p_outfile, p_config_key):
+def process_input_files(p_config, p_outfile, p_config_key, p_pending=None):
     input_path = p_config[p_config_key]['input_directory']
     race_data = p_config[p_config_key]
-    for input_file in race_data['input_files']:
+    for index, input_file in enumerate(race_data['input_files']):
         full_input_file = os.path.join(input_path, input_file["file"])
-        process_single_file(input_file, p_outfile, full_input_file)
+        if p_pending is not None and (p_config_key, index) in p_pending:
+            p_outfile.write_text(p_pending[(p_config_key, index)].get())
+        else:
+            process_single_file(input_file, p_outfile, full_input_file)
     return
 
-def process_single_race( p_config, p_outfile, p_config_key):
+def process_single_race( p_config, p_outfile, p_config_key, p_pending=None):
     if doesJsonKeyExist(p_config, p_config_key):
         print ' Found data for ' + p_config_key + '. Processing this race.'
-        process_input_files(p_config, p_outfile, p_config_key)
+        process_input_files(p_config, p_outfile, p_config_key, p_pending)
     else:
         print ' Config file doesn\'t contain data for ' + p_config_key + '. Skipping this race.'
     return
 
-def process_config_data(p_config, p_outfile):
+def process_config_data(p_config, p_outfile, p_pending=None):
     print_header(p_outfile)
-    #process_single_race(p_config, p_outfile, 'president')
-    #process_single_race(p_config, p_outfile, 'us_house')
-    #process_single_race(p_config, p_outfile, 'us_senate')
-    process_single_race(p_config, p_outfile, 'nj_senate')
-    process_single_race(p_config, p_outfile, 'nj_assembly')
-    process_single_race(p_config, p_outfile, 'governor')
+    for race in CONST_RACES:
+        process_single_race(p_config, p_outfile, race, p_pending)
     return
 
 validateArgs( args )
 config = readJsonConfig( args )
 out_file = openOutputFile(config)
-process_config_data(config, out_file)
+pool = None
+pending = None
+if args.jobs > 1:
+    pool = multiprocessing.Pool(args.jobs)
+    pending = start_input_files(pool, config, CONST_RACES, process_single_file)
+try:
+    process_config_data(config, out_file, pending)
+finally:
+    if pool is not None:
+        pool.terminate()
+        pool.join()
 #try:
 #    process_config_data(config, out_file)
 #except Exception as e:
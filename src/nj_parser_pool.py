@@ -0,0 +1,66 @@
+#!/usr/bin/python
+# MIT License
+# 
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+# 
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+# Shared by the tabula parsers that take --jobs. Input files are parsed by
+# a pool of worker processes and the rows of each file come back as CSV
+# text, which the parent writes out in config order.
+
+import os.path
+import csv
+from cStringIO import StringIO
+
+# Writes rows to the output file, or text that a worker process has already
+# written out as CSV rows.
+class OutputWriter:
+
+    def __init__(self, p_file):
+        self.file = p_file
+        self.writer = csv.writer(p_file, quoting=csv.QUOTE_MINIMAL)
+
+    def writerow(self, p_row):
+        self.writer.writerow(p_row)
+
+    def write_text(self, p_text):
+        self.file.write(p_text)
+
+# Runs in a worker process and returns the rows of one input file written
+# out as CSV text by the parser's process_single_file.
+def parse_input_file(p_task):
+    process_single_file, input_file, full_input_file = p_task
+    writer = OutputWriter(StringIO())
+    process_single_file(input_file, writer, full_input_file)
+    return writer.file.getvalue()
+
+# Hands every existing input file of the races in p_races to the pool, keyed
+# by race and position in the config. Missing files are left to the
+# sequential code so their errors are printed in config order.
+def start_input_files(p_pool, p_config, p_races, p_process_single_file):
+    pending = {}
+    for race in p_races:
+        if race in p_config:
+            input_path = p_config[race]['input_directory']
+            for index, input_file in enumerate(p_config[race]['input_files']):
+                full_input_file = os.path.join(input_path, input_file["file"])
+                if os.path.isfile(full_input_file):
+                    pending[(race, index)] = p_pool.apply_async(parse_input_file,
+                                                                ((p_process_single_file, input_file, full_input_file),))
+    return pending
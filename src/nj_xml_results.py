@@ -0,0 +1,212 @@
+#!/usr/bin/python
+# MIT License
+# 
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+# 
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+# 
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+# Shared by the county XML results parsers. Clarity XML results files hold
+# ElectionResult -> Contest -> Choice -> VoteType -> Precinct elements; the
+# precinct votes of the 'Election' vote type are written out for each
+# contest that is asked for.
+#
+# A parser script only holds a contest map, an OrderedDict of county name to
+# { 'in_file': ..., 'out_file': ..., 'contests': [(XML contest text, office,
+# district), ...] }, and hands it to main().
+
+import sys
+import argparse
+import csv
+import multiprocessing
+import xml.etree.ElementTree
+from cStringIO import StringIO
+
+CONST_HEADER = ('county', 'precinct', 'office', 'district', 'candidate', 'party', 'votes')
+
+class ContestConfig (object):
+
+    def __init__ (self, xmlKey, county, office, district):
+        self.county = county
+        self.xmlKey = xmlKey
+        self.office = office
+        self.district = district
+        self.party = ''
+        self.precinct = ''
+        self.candidate = ''
+        self.votes = 0
+
+    def parsePartyCandidateLine(self, textValue):
+        #print '       Parsing Party/Candidate: ' + textValue
+        if ((textValue.lower() != 'write-in') and (textValue.lower() != 'personal choice')):
+            newValues = textValue.split('-', 1)
+            self.party = newValues[0].strip()
+            self.candidate = newValues[1].strip()
+        else:
+            self.party = ''
+            self.candidate = textValue
+        return
+
+    def printCSVLine(self, outFile):
+        outFile.writerow( (self.county, self.precinct, self.office, self.district, self.candidate, self.party, self.votes) )
+        return
+
+def openOutputFile(outputPath):
+    try:
+        f = open( outputPath, 'w') 
+    except:
+        sys.exit('ERROR: Could not open output file: ' + outputPath)
+    return f
+
+def processPrecinct(xmlNode, xmlConfig, outFile):
+    #print ('            Precinct:' + xmlNode.get('name'))
+    xmlConfig.precinct = xmlNode.get('name')
+    xmlConfig.votes = xmlNode.get('votes')
+    xmlConfig.printCSVLine(outFile)
+    return
+
+# Streams the results file once and returns the CSV lines of every contest
+# in xmlConfigs, keyed by the position of the config in the list. Contests
+# are looked up by their text as they go by, and every subtree is cleared
+# once it has been read, so memory use does not grow with the file. Only
+# the first contest with a given text is used, and reading stops as soon as
+# all the contests asked for have been seen.
+def extractContests(in_file, xmlConfigs):
+    contestsByKey = {}
+    for index, xmlConfig in enumerate(xmlConfigs):
+        contestsByKey.setdefault(xmlConfig.xmlKey, []).append(index)
+
+    contestTexts = {}
+    remaining = len(contestsByKey)
+    current = None
+    inElection = False
+    depth = 0
+    root = None
+    with open(in_file, 'rb') as f:
+        for event, xmlNode in xml.etree.ElementTree.iterparse(f, events=('start', 'end')):
+            if event == 'start':
+                depth += 1
+                if root is None:
+                    root = xmlNode
+                elif xmlNode.tag == 'Contest':
+                    indexes = contestsByKey.pop(xmlNode.get('text'), None)
+                    if indexes is not None:
+                        current = [(index, StringIO()) for index in indexes]
+                        writers = [csv.writer(text, quoting=csv.QUOTE_MINIMAL) for index, text in current]
+                elif current is None:
+                    continue
+                elif xmlNode.tag == 'Choice':
+                    for index, text in current:
+                        xmlConfigs[index].parsePartyCandidateLine(xmlNode.get('text'))
+                elif xmlNode.tag == 'VoteType':
+                    inElection = (xmlNode.get('name') == 'Election')
+                elif xmlNode.tag == 'Precinct' and inElection:
+                    for (index, text), writer in zip(current, writers):
+                        processPrecinct(xmlNode, xmlConfigs[index], writer)
+                continue
+
+            depth -= 1
+            if xmlNode.tag == 'VoteType':
+                inElection = False
+            elif xmlNode.tag == 'Choice':
+                xmlNode.clear()
+            elif xmlNode.tag == 'Contest' and current is not None:
+                for index, text in current:
+                    contestTexts[index] = text.getvalue()
+                current = None
+                remaining -= 1
+                if remaining == 0:
+                    break
+            if depth == 1:
+                root.clear()
+    return contestTexts
+
+# Writes the precinct results of the contests in xmlConfigs to out_file, in
+# the order they are listed, reading in_file once for all of them. Returns
+# the progress messages instead of printing them.
+def processXmlFile(in_file, out_file, xmlConfigs):
+    messages = []
+    contestTexts = extractContests(in_file, xmlConfigs)
+    with openOutputFile(out_file) as f:
+        csv.writer(f, quoting=csv.QUOTE_MINIMAL).writerow(CONST_HEADER)
+        for index, xmlConfig in enumerate(xmlConfigs):
+            if index not in contestTexts:
+                messages.append('**** WARNING *****   Unable to find XML Node for contest ' + xmlConfig.xmlKey)
+                continue
+            messages.append('Single Contest:' + xmlConfig.xmlKey)
+            f.write(contestTexts[index])
+    return messages
+
+# Runs in a worker process for one county of a contest map and returns
+# (failed, messages). A county that fails reports its error instead of
+# stopping the other counties.
+def processCountyXmlFile(task):
+    county, countyMap = task
+    xmlConfigs = [ContestConfig(xmlKey, county, office, district)
+                  for xmlKey, office, district in countyMap['contests']]
+    try:
+        return (False, processXmlFile(countyMap['in_file'], countyMap['out_file'], xmlConfigs))
+    except (Exception, SystemExit) as e:
+        return (True, ['ERROR: ' + county + ' County failed: ' + str(e)])
+
+# Writes the precinct file of every county in p_counties, p_jobs counties at
+# a time. Messages are printed county by county in p_counties order. Returns
+# the counties that failed.
+def processContestMap(p_contestMap, p_counties, p_jobs=1):
+    tasks = [(county, p_contestMap[county]) for county in p_counties]
+    if p_jobs > 1 and len(tasks) > 1:
+        pool = multiprocessing.Pool(min(p_jobs, len(tasks)))
+        try:
+            results = pool.map(processCountyXmlFile, tasks, 1)
+        finally:
+            pool.terminate()
+            pool.join()
+    else:
+        results = map(processCountyXmlFile, tasks)
+    failedCounties = []
+    for county, (failed, messages) in zip(p_counties, results):
+        print ' ***** ' + county + ' County *****'
+        for message in messages:
+            print message
+        if failed:
+            failedCounties.append(county)
+    return failedCounties
+
+# Counties in p_disabledCounties keep their command line flags, but are not
+# parsed and are left out of --all.
+def handleArguments(p_contestMap, p_disabledCounties=()):
+    arg_parser = argparse.ArgumentParser(description='Parse New Jersey Count data.')
+    for county in sorted(list(p_contestMap) + list(p_disabledCounties)):
+        arg_parser.add_argument('--' + county.lower(), dest=county, help='run for ' + county + ' county', action='store_true')
+    arg_parser.add_argument('--all', help='run for every county', action='store_true')
+    arg_parser.add_argument('--jobs', '-j', type=int, default=multiprocessing.cpu_count(), help='number of counties to parse at once')
+    return arg_parser.parse_args()
+
+def getCounties(p_args, p_contestMap, p_disabledCounties=()):
+    selected = [county for county in sorted(list(p_contestMap) + list(p_disabledCounties))
+                if getattr(p_args, county) or (p_args.all and county in p_contestMap)]
+    for county in selected:
+        print ' ***** Running for ' + county + ' County *****'
+    if len(selected) == 0:
+        sys.exit(' ***** ERROR -- No county specified *****')
+    return [county for county in p_contestMap if county in selected]
+
+def main(p_contestMap, p_disabledCounties=()):
+    args = handleArguments(p_contestMap, p_disabledCounties)
+    failedCounties = processContestMap(p_contestMap, getCounties(args, p_contestMap, p_disabledCounties), args.jobs)
+    if len(failedCounties) > 0:
+        sys.exit(' ***** ERROR -- No precinct file written for ' + ', '.join(failedCounties) + ' *****')
@@ -0,0 +1,72 @@
+#!/usr/bin/python
+#
+# MIT License
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+
+import sys
+import argparse
+from nj_common import *
+
+def main():
+
+    args = handle_arguments()
+    elections = group_files_by_election(find_results_files(args.root))
+
+    error_count = 0
+    for election in sorted(elections):
+        if len(args.elections) > 0 and not any(election.startswith(prefix) for prefix in args.elections):
+            continue
+        election_files = [f for f in elections[election] if args.level is None or f[2] == args.level]
+        if len(election_files) > 0:
+            error_count += check_election(args, election, election_files)
+
+    print "There are " + str(error_count) + " candidates associated to conflicting values."
+
+def handle_arguments():
+    arg_parser = argparse.ArgumentParser(description='Check that each candidate has one party, office and district across the files of an election')
+    arg_parser.add_argument('elections', nargs='*', help='election dates or prefixes such as 20171107 (default: all)')
+    arg_parser.add_argument('--verbose', '-v', dest='verbose',  help='report information verbosely', action='store_true')
+    arg_parser.add_argument('--case', '-c', dest='case',  help='case sensitive text compare', action='store_true')
+    arg_parser.add_argument('--level', '-l', dest='level', choices=CONST_LEVELS, help='only check files of this level')
+    arg_parser.add_argument('--root', '-r', dest='root', default='..', help='directory holding the year directories')
+    return arg_parser.parse_args()
+
+def check_election(args, election, election_files):
+
+    relationship_index = RelationshipIndex()
+    for results_file, county_name, level in election_files:
+        relationship_index.add_file(VerifyCounty(results_file, args.verbose, args.case))
+
+    error_count = 0
+    for attribute_name in relationship_index.attribute_names:
+        conflicts = relationship_index.get_conflicts(attribute_name)
+        if args.verbose:
+            for key, values in conflicts:
+                print key + ' is associated to multiple ' + attribute_name + ' values: ' + \
+                      ', '.join(value + ' (' + source + ')' for value, source in values)
+        print election + ': ' + str(len(conflicts)) + ' candidates with conflicting ' + attribute_name + ' values'
+        error_count += len(conflicts)
+
+    return error_count
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/python
+#
+# MIT License
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+import sys
+import argparse
+from collections import OrderedDict
+from nj_common import *
+
+def main():
+
+    args = handle_arguments()
+
+    test_names = args.tests
+    if len(test_names) == 0:
+        test_names = CONST_DATA_TESTS.keys()
+
+    results_files = args.files
+    if results_files is None:
+        results_files = find_results_files(args.root)
+
+    failure_counts = OrderedDict((test_name, 0) for test_name in test_names)
+    for results_file in results_files:
+        results = run_data_tests(results_file, test_names)
+        for test_name in results:
+            failures = results[test_name]
+            failure_counts[test_name] += len(failures)
+            if len(failures) > 0:
+                print results_file + ': ' + str(len(failures)) + ' ' + test_name + ' failures'
+                if args.verbose:
+                    for line_number, message in failures:
+                        print '    line ' + str(line_number) + ': ' + message
+
+    for test_name in failure_counts:
+        print 'There were ' + str(failure_counts[test_name]) + ' ' + test_name + ' failures.'
+
+    if sum(failure_counts.values()) > 0:
+        sys.exit(1)
+
+def handle_arguments():
+    arg_parser = argparse.ArgumentParser(description='Run the data tests from the Data Tests workflow locally')
+    arg_parser.add_argument('tests', nargs='*', help='tests to run: ' + ', '.join(CONST_DATA_TESTS.keys()) + ' (default: all)')
+    arg_parser.add_argument('--verbose', '-v', dest='verbose',  help='report every failure', action='store_true')
+    arg_parser.add_argument('--files', '-f', dest='files', nargs='+', help='only check these files')
+    arg_parser.add_argument('--root', '-r', dest='root', default='..', help='directory holding the year directories')
+    args = arg_parser.parse_args()
+    for test_name in args.tests:
+        if test_name not in CONST_DATA_TESTS:
+            arg_parser.error('unknown test: ' + test_name)
+    return args
+
+if __name__ == '__main__':
+    main()
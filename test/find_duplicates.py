@@ -0,0 +1,62 @@
+#!/usr/bin/python
+#
+# MIT License
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+import sys
+import argparse
+from nj_common import *
+
+def main():
+
+    args = handle_arguments()
+
+    results_files = args.files
+    if results_files is None:
+        results_files = find_results_files(args.root)
+
+    # Keys carry the election, level and county of the file so rows are only
+    # compared against rows of files covering the same ground. A statewide
+    # file and the per-county files of the same level repeat each other's
+    # rows by design, so they are not compared with each other.
+    detector = DuplicateDetector()
+    for results_file in results_files:
+        election, county_name, level = parse_results_file_name(results_file)
+        detector.read_file(results_file, (election, level, county_name or ''))
+
+    duplicates = detector.find_duplicates()
+    for file_name, line_number, first_file_name, first_line_number, key in duplicates:
+        if args.verbose:
+            print file_name + ' line ' + str(line_number) + ' duplicates ' + \
+                  first_file_name + ' line ' + str(first_line_number) + ': ' + \
+                  ','.join(value for value in key if value != '')
+
+    print 'There are ' + str(len(duplicates)) + ' duplicate rows in ' + str(len(results_files)) + ' files.'
+
+def handle_arguments():
+    arg_parser = argparse.ArgumentParser(description='Find duplicate rows across New Jersey results files')
+    arg_parser.add_argument('--verbose', '-v', dest='verbose',  help='report every duplicate', action='store_true')
+    arg_parser.add_argument('--files', '-f', dest='files', nargs='+', help='only check these files')
+    arg_parser.add_argument('--root', '-r', dest='root', default='..', help='directory holding the year directories')
+    return arg_parser.parse_args()
+
+if __name__ == '__main__':
+    main()
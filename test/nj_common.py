@@ -22,8 +22,25 @@
 # WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
 import sys
+import os
+import re
 import csv
+import json
+import hashlib
+import struct
+import time
+import cProfile
+import pstats
+from array import array
 from collections import defaultdict
+from collections import OrderedDict
+from collections import namedtuple
+from itertools import izip
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 CONST_COUNTIES = [ 'Atlantic', 
                    'Bergen', 
@@ -108,6 +125,54 @@ CONST_STATE_DISTRICTS = [ "1",
                           "39",
                           "40" ]
 
+CONST_LEVELS = [ 'county',
+                 'municipal',
+                 'precinct' ]
+
+CONST_VOTE_INDEX_KEYS = ( 'county',
+                          'office',
+                          'district',
+                          'candidate' )
+
+# Bump a check's version whenever its logic changes so that cached clean
+# results recorded by the old logic are no longer trusted.
+CONST_CHECK_VERSIONS = { 'counties': 1,
+                         'offices': 1,
+                         'districts': 1,
+                         'votes': 1,
+                         'candidate_party': 1,
+                         'candidate_office': 1,
+                         'candidate_district': 1 }
+
+# Columns that identify a result row; every other column except votes is
+# treated as a vote breakdown (early_voting, election_day, mail, ...).
+CONST_IDENTITY_COLUMNS = [ 'county',
+                           'precinct',
+                           'municipality',
+                           'office',
+                           'district',
+                           'party',
+                           'candidate' ]
+
+CONST_REQUIRED_COLUMNS = [ 'county',
+                           'precinct',
+                           'municipality',
+                           'office',
+                           'votes' ]
+
+CONST_NAME_SUFFIX = re.compile(r',?\s+(jr|sr|ii|iii|iv)\.?$')
+
+CONST_MISSING_CODE = -1
+
+CONST_PROFILE_FUNCTIONS = 10
+
+# Most key hashes DuplicateDetector holds as Python objects at once.
+CONST_HASH_BUCKET_SIZE = 1 << 20
+
+# label is the key as spelled in the files, which differs from key when
+# candidate names were mapped while grouping.
+VoteMismatch = namedtuple('VoteMismatch', ['key', 'upper_votes', 'lower_votes', 'delta', 'label'])
+
 def is_number(test_value):
     try:
         float(test_value)
@@ -115,20 +180,796 @@ def is_number(test_value):
     except ValueError:
         return False
 
+def county_name_from_slug(slug):
+    compare_slug = slug.replace('_', '').replace(' ', '').lower()
+    for county_name in CONST_COUNTIES:
+        if county_name.replace(' ', '').lower() == compare_slug:
+            return county_name
+    return None
+
+# Splits a results file name such as 20171107__nj__general__essex__precinct.csv
+# into its election prefix, county name (None for statewide files) and level.
+def parse_results_file_name(file_name):
+    parts = os.path.basename(file_name).replace('.csv', '').split('__')
+    level = 'county'
+    if parts[-1] in CONST_LEVELS:
+        level = parts.pop()
+    county_name = None
+    if len(parts) > 3:
+        county_name = county_name_from_slug(parts[-1])
+        if county_name is not None:
+            parts.pop()
+    return '__'.join(parts), county_name, level
+
+# Reads only the first row of a results file, dropping any UTF-8 byte order mark.
+def read_header(csv_reader):
+    for row in csv_reader:
+        if len(row) > 0 and row[0].startswith('\xef\xbb\xbf'):
+            row[0] = row[0][3:]
+        return row
+    return []
+
+def find_results_files(root_directory):
+    results_files = []
+    for year_directory in sorted(os.listdir(root_directory)):
+        year_path = os.path.join(root_directory, year_directory)
+        if not (year_directory.isdigit() and os.path.isdir(year_path)):
+            continue
+        for dir_path, dir_names, file_names in os.walk(year_path):
+            dir_names.sort()
+            for file_name in sorted(file_names):
+                if file_name.endswith('.csv'):
+                    results_files.append(os.path.join(dir_path, file_name))
+    return results_files
+
+def group_files_by_election(results_files):
+    elections = defaultdict(list)
+    for results_file in results_files:
+        election, county_name, level = parse_results_file_name(results_file)
+        elections[election].append((results_file, county_name, level))
+    return elections
+
+# Groups both verifiers once by key_names and joins the two groupings,
+# returning a VoteMismatch for every key whose totals differ. Keys found
+# only in the lower file are skipped unless include_lower_only is True.
+# Mismatches are labelled with the upper file's spelling of the key.
+def reconcile_votes(upper_verifier, lower_verifier, key_names=('county', 'candidate'), counties=None,
+                    candidate_map=None, include_lower_only=False):
+    labels = {}
+    upper_votes = upper_verifier.group_votes(key_names, counties, candidate_map, labels)
+    lower_votes = lower_verifier.group_votes(key_names, counties, candidate_map, labels)
+    return compare_votes(upper_votes, lower_votes, include_lower_only, labels)
+
+def compare_votes(upper_votes, lower_votes, include_lower_only=True, labels=None):
+    if labels is None:
+        labels = {}
+    keys = set(upper_votes)
+    if include_lower_only:
+        keys |= set(lower_votes)
+
+    mismatches = []
+    for key in sorted(keys):
+        delta = lower_votes.get(key, 0) - upper_votes.get(key, 0)
+        if delta != 0:
+            mismatches.append(VoteMismatch(key, upper_votes.get(key, 0), lower_votes.get(key, 0), delta,
+                                           labels.get(key, key)))
+    return mismatches
+
+def report_mismatches(mismatches, upper_label, lower_label, verbose):
+    if verbose:
+        for mismatch in mismatches:
+            print 'Total votes are different in ' + upper_label + ' (' + \
+                  str(mismatch.upper_votes) + ') and ' + lower_label + ' (' + \
+                  str(mismatch.lower_votes) + ') for ' + ' / '.join(mismatch.label) + \
+                  ' (delta ' + str(mismatch.delta) + ').'
+    return len(mismatches)
+
+# Loads a spot check manifest, either a CSV with candidate, county and votes
+# columns or a JSON list of objects with the same keys.
+def load_spot_checks(manifest_file):
+    spot_checks = []
+    with open(manifest_file, 'rb') as m_file:
+        if manifest_file.endswith('.json'):
+            entries = json.load(m_file)
+        else:
+            entries = csv.DictReader(m_file)
+        for entry in entries:
+            spot_checks.append((entry['candidate'], entry['county'], int(entry['votes'])))
+    return spot_checks
+
+def run_spot_checks(county_verifier, spot_checks, verbose):
+    error_count = 0
+    county_votes = county_verifier.group_votes(('county', 'candidate'))
+    for candidate_name, county_name, total_votes in spot_checks:
+        vote_calc = county_votes.get((county_name, candidate_name), 0)
+        if vote_calc != total_votes:
+            error_count += 1
+            if verbose:
+                print candidate_name + ' / ' + county_name + ' value is ' + str(vote_calc) + \
+                      '  ---  Expected value: ' + str(total_votes)
+    return error_count
+
+# Maps the candidate spellings used by a source file onto the names used in
+# the county file. Names without an alias fall back to a normalized form
+# (case-folded, whitespace collapsed, "Jr."/"Sr." style suffixes unified).
+class CandidateAliases:
+
+    def __init__(self, alias_file=None):
+        self.aliases = {}
+        self.canonical_names = {}
+        if alias_file is not None:
+            self.load(alias_file)
+
+    def load(self, alias_file):
+        with open(alias_file, 'rb') as a_file:
+            for entry in csv.DictReader(a_file):
+                self.aliases[entry['alias']] = self.normalize(entry['candidate'])
+        self.canonical_names = {}
+
+    def normalize(self, candidate_name):
+        normalized_name = ' '.join(candidate_name.lower().split())
+        return CONST_NAME_SUFFIX.sub(r' \1', normalized_name)
+
+    def canonical_name(self, candidate_name):
+        if candidate_name not in self.canonical_names:
+            if candidate_name in self.aliases:
+                self.canonical_names[candidate_name] = self.aliases[candidate_name]
+            else:
+                self.canonical_names[candidate_name] = self.normalize(candidate_name)
+        return self.canonical_names[candidate_name]
+
+# Remembers files that passed their checks, keyed by a hash of the file
+# contents plus the versions of the checks that were run, so unchanged files
+# can be skipped on the next run.
+class ValidationCache:
+
+    def __init__(self, cache_file):
+        self.cache_file = cache_file
+        self.entries = {}
+        self.added_entries = {}
+        self.file_hashes = {}
+        if os.path.isfile(cache_file):
+            with open(cache_file, 'rb') as c_file:
+                self.entries = json.load(c_file)
+
+    def file_hash(self, file_name):
+        if file_name not in self.file_hashes:
+            digest = hashlib.sha1()
+            with open(file_name, 'rb') as in_file:
+                for chunk in iter(lambda: in_file.read(1 << 20), b''):
+                    digest.update(chunk)
+            self.file_hashes[file_name] = digest.hexdigest()
+        return self.file_hashes[file_name]
+
+    def cache_key(self, verifier, check_names):
+        checks = [name + ':' + str(CONST_CHECK_VERSIONS.get(name, 0)) for name in check_names]
+        return self.file_hash(verifier.file_name) + '|' + verifier.__class__.__name__ + '|' + \
+               str(verifier.ignore_case) + '|' + ','.join(checks)
+
+    def is_clean(self, verifier, check_names):
+        return self.cache_key(verifier, check_names) in self.entries
+
+    def record(self, verifier, check_names, results):
+        if sum(results.values()) == 0:
+            key = self.cache_key(verifier, check_names)
+            self.entries[key] = verifier.file_name
+            self.added_entries[key] = verifier.file_name
+
+    def merge(self, entries):
+        self.entries.update(entries)
+
+    def save(self):
+        with open(self.cache_file, 'wb') as c_file:
+            json.dump(self.entries, c_file, indent=1, sort_keys=True)
+
+# Collects a JSON-ready entry for every verified file: rows scanned, bytes
+# read, wall time, and the error count and time of each check. With profile
+# set, every check runs under its own cProfile and the entry keeps the
+# functions it spent the most time in.
+class ValidationReport:
+
+    def __init__(self, profile=False):
+        self.profile = profile
+        self.files = []
+
+    def add_file(self, verifier, results, seconds, checks=None):
+        entry = OrderedDict()
+        entry['file'] = verifier.file_name
+        entry['verifier'] = verifier.__class__.__name__
+        entry['cached'] = checks is None
+        entry['rows'] = 0
+        entry['bytes'] = 0
+        entry['parse_seconds'] = 0.0
+        if checks is not None:
+            entry['rows'] = verifier.get_parsed_file().get_row_count()
+            entry['bytes'] = verifier.get_parsed_file().byte_count
+            entry['parse_seconds'] = verifier.get_parsed_file().parse_seconds
+        entry['seconds'] = seconds
+        entry['checks'] = OrderedDict()
+        for check_name in results:
+            entry['checks'][check_name] = OrderedDict([('errors', results[check_name]), ('seconds', 0.0)])
+        for check in checks or []:
+            entry['checks'][check.name]['seconds'] = check.seconds
+            if check.profiler is not None:
+                entry['checks'][check.name]['profile'] = profile_summary(check.profiler)
+        self.files.append(entry)
+
+    def merge(self, entries):
+        self.files.extend(entries)
+
+    def get_totals(self):
+        totals = OrderedDict()
+        for name in ['files', 'rows', 'bytes', 'parse_seconds', 'seconds']:
+            totals[name] = 0
+        totals['checks'] = OrderedDict()
+        for entry in self.files:
+            totals['files'] += 1
+            for name in ['rows', 'bytes', 'parse_seconds', 'seconds']:
+                totals[name] += entry[name]
+            for check_name, check in entry['checks'].iteritems():
+                check_totals = totals['checks'].setdefault(check_name, OrderedDict([('errors', 0), ('seconds', 0.0)]))
+                check_totals['errors'] += check['errors']
+                check_totals['seconds'] += check['seconds']
+        return totals
+
+    def save(self, report_file):
+        report = OrderedDict([('totals', self.get_totals()),
+                              ('files', sorted(self.files, key=lambda entry: entry['file']))])
+        with open(report_file, 'wb') as r_file:
+            json.dump(report, r_file, indent=1)
+
+# The functions a profiled check spent the most cumulative time in. A check
+# that never ran, on a file with no data rows, has none.
+def profile_summary(profiler, limit=CONST_PROFILE_FUNCTIONS):
+    functions = []
+    if len(profiler.getstats()) == 0:
+        return functions
+    stats = pstats.Stats(profiler).stats
+    for function, (primitive_calls, calls, total_time, cumulative_time, callers) in \
+            sorted(stats.iteritems(), key=lambda item: item[1][3], reverse=True)[:limit]:
+        functions.append(OrderedDict([('function', pstats.func_std_string(function)),
+                                      ('calls', calls),
+                                      ('seconds', total_time),
+                                      ('cumulative_seconds', cumulative_time)]))
+    return functions
+
+def is_integer(test_value):
+    try:
+        int(test_value)
+        return True
+    except ValueError:
+        return False
+
+# Lower-cases and strips the header values, dropping any UTF-8 byte order mark.
+def clean_header(header):
+    cleaned_header = [value.strip().lower() for value in header]
+    if len(cleaned_header) > 0 and cleaned_header[0].startswith('\xef\xbb\xbf'):
+        cleaned_header[0] = cleaned_header[0][3:]
+    return cleaned_header
+
+def identity_key_indexes(header):
+    return [header.index(column) if column in header else -1 for column in CONST_IDENTITY_COLUMNS]
+
+# Builds the (county, precinct, municipality, office, district, party,
+# candidate) key of a row; columns the file doesn't have are left empty.
+def identity_key(row, key_indexes, prefix=()):
+    return prefix + tuple(row[i] if 0 <= i < len(row) else '' for i in key_indexes)
+
+def read_identity_keys(file_name, prefix=()):
+    with open(file_name, 'rb') as in_file:
+        for line_number, row in enumerate(csv.reader(in_file), 1):
+            if line_number == 1:
+                key_indexes = identity_key_indexes(clean_header(row))
+            else:
+                yield line_number, identity_key(row, key_indexes, prefix)
+
+# Finds rows sharing the same identity key. Only a hash of each key (the
+# width of a C long, 64 bits on most platforms) and the file and line it
+# came from are kept while reading; rows whose hashes collide are re-read
+# in a second pass to confirm the duplicate, so memory stays small even
+# when many files are checked together.
+class DuplicateDetector:
+
+    def __init__(self):
+        self.file_names = []
+        self.key_prefixes = []
+        self.key_hashes = array('l')
+        self.file_numbers = array('i')
+        self.line_numbers = array('i')
+
+    def hash_key(self, key):
+        digest = hashlib.md5('\x1f'.join(key)).digest()
+        return struct.unpack('l', digest[:self.key_hashes.itemsize])[0]
+
+    def add_file(self, file_name, prefix=()):
+        self.file_names.append(file_name)
+        self.key_prefixes.append(prefix)
+        return len(self.file_names) - 1
+
+    def add_row(self, file_number, line_number, key):
+        self.key_hashes.append(self.hash_key(key))
+        self.file_numbers.append(file_number)
+        self.line_numbers.append(line_number)
+
+    def read_file(self, file_name, prefix=()):
+        file_number = self.add_file(file_name, prefix)
+        for line_number, key in read_identity_keys(file_name, prefix):
+            self.add_row(file_number, line_number, key)
+
+    # Returns the hashes seen more than once. The hashes are split into
+    # buckets of about CONST_HASH_BUCKET_SIZE by their value and each bucket
+    # is checked in its own pass, so no more than one bucket of them is ever
+    # held as Python objects.
+    def find_repeated_hashes(self):
+        bucket_count = len(self.key_hashes) // CONST_HASH_BUCKET_SIZE + 1
+        repeated_hashes = set()
+        for bucket in xrange(bucket_count):
+            seen_hashes = set()
+            for key_hash in self.key_hashes:
+                if key_hash % bucket_count == bucket:
+                    if key_hash in seen_hashes:
+                        repeated_hashes.add(key_hash)
+                    else:
+                        seen_hashes.add(key_hash)
+        return repeated_hashes
+
+    # Returns (file, line, first file, first line, key) for every confirmed
+    # duplicate, in file and line order.
+    def find_duplicates(self):
+        repeated_hashes = self.find_repeated_hashes()
+        suspect_lines = defaultdict(set)
+        for key_hash, file_number, line_number in izip(self.key_hashes, self.file_numbers, self.line_numbers):
+            if key_hash in repeated_hashes:
+                suspect_lines[file_number].add(line_number)
+
+        duplicates = []
+        first_seen = {}
+        for file_number in sorted(suspect_lines):
+            file_name = self.file_names[file_number]
+            for line_number, key in read_identity_keys(file_name, self.key_prefixes[file_number]):
+                if line_number in suspect_lines[file_number]:
+                    if key in first_seen:
+                        first_file_name, first_line_number = first_seen[key]
+                        duplicates.append((file_name, line_number, first_file_name, first_line_number,
+                                           key[len(self.key_prefixes[file_number]):]))
+                    else:
+                        first_seen[key] = (file_name, line_number)
+        return duplicates
+
+# The data test rules below mirror the duplicate_entries, file_format,
+# missing_values and vote_breakdown_totals tests run by the Data Tests
+# workflow. Each rule sees the raw header once and then every row, so any
+# combination of them can share a single pass over a file.
+class DataTestRule:
+
+    def __init__(self, name, file_name):
+        self.name = name
+        self.file_name = file_name
+        self.header = []
+        self.failures = []
+
+    def process_header(self, header):
+        self.header = clean_header(header)
+
+    def column_indexes(self, column_names):
+        return [i for i, value in enumerate(self.header) if value in column_names]
+
+    def add_failure(self, line_number, message):
+        self.failures.append((line_number, message))
+
+    def finish(self):
+        return
+
+    def get_failures(self):
+        return self.failures
+
+class FileFormatRule(DataTestRule):
+
+    def __init__(self, file_name):
+        DataTestRule.__init__(self, 'file_format', file_name)
+
+    def process_header(self, header):
+        DataTestRule.process_header(self, header)
+        if len(header) > 0 and header[0].startswith('\xef\xbb\xbf'):
+            self.add_failure(1, 'Header starts with a byte order mark')
+        for value in header:
+            if value.strip() == '':
+                self.add_failure(1, 'Header contains an empty column name')
+            elif value != value.strip():
+                self.add_failure(1, 'Header value [' + value + '] has leading or trailing whitespace')
+            elif value != value.lower():
+                self.add_failure(1, 'Header value [' + value + '] is not lowercase')
+        if len(set(self.header)) != len(self.header):
+            self.add_failure(1, 'Header contains duplicate column names')
+        self.vote_indexes = self.column_indexes([name for name in self.header
+                                                 if name not in CONST_IDENTITY_COLUMNS])
+
+    def process_row(self, line_number, row):
+        if len(row) != len(self.header):
+            self.add_failure(line_number, 'Row has ' + str(len(row)) + ' values but the header has ' +
+                                          str(len(self.header)))
+            return
+        for value in row:
+            if value != value.strip():
+                self.add_failure(line_number, 'Value [' + value + '] has leading or trailing whitespace')
+        for i in self.vote_indexes:
+            if row[i] != '' and not is_integer(row[i]):
+                self.add_failure(line_number, 'Vote value [' + row[i] + '] in column ' + self.header[i] +
+                                              ' is not an integer')
+
+class MissingValuesRule(DataTestRule):
+
+    def __init__(self, file_name):
+        DataTestRule.__init__(self, 'missing_values', file_name)
+
+    def process_header(self, header):
+        DataTestRule.process_header(self, header)
+        self.required_indexes = self.column_indexes(CONST_REQUIRED_COLUMNS)
+
+    def process_row(self, line_number, row):
+        for i in self.required_indexes:
+            if i >= len(row) or row[i].strip() == '':
+                self.add_failure(line_number, 'Missing value for ' + self.header[i])
+
+class DuplicateEntriesRule(DataTestRule):
+
+    def __init__(self, file_name):
+        DataTestRule.__init__(self, 'duplicate_entries', file_name)
+        self.detector = DuplicateDetector()
+        self.file_number = self.detector.add_file(file_name)
+
+    def process_header(self, header):
+        DataTestRule.process_header(self, header)
+        self.key_indexes = identity_key_indexes(self.header)
+
+    def process_row(self, line_number, row):
+        self.detector.add_row(self.file_number, line_number, identity_key(row, self.key_indexes))
+
+    def finish(self):
+        for file_name, line_number, first_file_name, first_line_number, key in self.detector.find_duplicates():
+            values = [value for value, i in zip(key, self.key_indexes) if i != -1]
+            self.add_failure(line_number, 'Duplicate of line ' + str(first_line_number) + ': ' + ','.join(values))
+
+# Collects votes and the breakdown columns as packed integer rows while
+# streaming, then checks every row's sum at once when the file is done.
+# An empty breakdown value counts as zero; rows with no votes, no breakdown
+# values at all, or values that are not integers are left to the other rules.
+class VoteBreakdownRule(DataTestRule):
+
+    def __init__(self, file_name):
+        DataTestRule.__init__(self, 'vote_breakdown_totals', file_name)
+        self.row_lines = array('l')
+        self.row_values = array('l')
+
+    def process_header(self, header):
+        DataTestRule.process_header(self, header)
+        self.votes_indexes = self.column_indexes(['votes'])
+        self.breakdown_indexes = self.column_indexes([name for name in self.header
+                                                      if name not in CONST_IDENTITY_COLUMNS and name != 'votes'])
+        self.value_indexes = self.votes_indexes + self.breakdown_indexes
+
+    def process_row(self, line_number, row):
+        if len(self.votes_indexes) != 1 or len(self.breakdown_indexes) == 0 or len(row) != len(self.header):
+            return
+        if row[self.votes_indexes[0]] == '' or all(row[i] == '' for i in self.breakdown_indexes):
+            return
+        try:
+            values = [int(row[i]) if row[i] != '' else 0 for i in self.value_indexes]
+        except ValueError:
+            return
+        self.row_lines.append(line_number)
+        self.row_values.extend(values)
+
+    def finish(self):
+        if len(self.row_lines) == 0:
+            return
+        for row_number, breakdown_total in self.find_mismatched_rows():
+            votes = self.row_values[row_number * len(self.value_indexes)]
+            self.add_failure(self.row_lines[row_number], 'Vote breakdown adds up to ' + str(breakdown_total) +
+                                                         ' but votes is ' + str(votes))
+
+    # Returns (row number, breakdown total) for every collected row whose
+    # breakdown columns do not add up to its votes.
+    def find_mismatched_rows(self):
+        column_count = len(self.value_indexes)
+        if numpy is not None:
+            values = numpy.frombuffer(self.row_values, dtype=numpy.int_).reshape(-1, column_count)
+            totals = values[:, 1:].sum(axis=1)
+            rows = numpy.nonzero(totals != values[:, 0])[0]
+            return [(int(row), int(totals[row])) for row in rows]
+        mismatches = []
+        for row in xrange(len(self.row_lines)):
+            start = row * column_count
+            breakdown_total = sum(self.row_values[start + 1:start + column_count])
+            if breakdown_total != self.row_values[start]:
+                mismatches.append((row, breakdown_total))
+        return mismatches
+
+CONST_DATA_TESTS = OrderedDict([ ('duplicate_entries', DuplicateEntriesRule),
+                                 ('file_format', FileFormatRule),
+                                 ('missing_values', MissingValuesRule),
+                                 ('vote_breakdown_totals', VoteBreakdownRule) ])
+
+# Runs the named data test rules over a file in a single pass and returns
+# an OrderedDict of rule name to its list of (line number, message) failures.
+def run_data_tests(file_name, test_names=None):
+    if test_names is None:
+        test_names = CONST_DATA_TESTS.keys()
+    rules = [CONST_DATA_TESTS[test_name](file_name) for test_name in test_names]
+
+    with open(file_name, 'rb') as in_file:
+        for line_number, row in enumerate(csv.reader(in_file), 1):
+            for rule in rules:
+                if line_number == 1:
+                    rule.process_header(row)
+                else:
+                    rule.process_row(line_number, row)
+
+    results = OrderedDict()
+    for rule in rules:
+        rule.finish()
+        results[rule.name] = rule.get_failures()
+    return results
+
+# Gives each distinct string an int code. Each parsed file has its own
+# vocabulary, so a county or candidate name is stored once per file and
+# every string of the file is freed along with it.
+class StringVocabulary:
+
+    def __init__(self):
+        self.codes = {}
+        self.strings = []
+
+    def encode(self, value):
+        code = self.codes.get(value)
+        if code is None:
+            code = len(self.strings)
+            self.codes[value] = code
+            self.strings.append(value)
+        return code
+
+    def decode(self, code):
+        return self.strings[code]
+
+# A results file parsed once into columns of vocabulary codes. Rows shorter
+# than the widest row are padded with CONST_MISSING_CODE and their lengths
+# kept, so rows rebuilt from the columns match the file exactly. Integer
+# columns and indexes built by the verifiers are kept alongside.
+class ParsedFile:
+
+    def __init__(self, file_name, modified_time):
+        self.file_name = file_name
+        self.modified_time = modified_time
+        self.vocabulary = StringVocabulary()
+        self.columns = []
+        self.row_lengths = array('i')
+        self.derived = {}
+
+        start_time = time.time()
+        with open(file_name, 'rb') as p_file:
+            p_reader = csv.reader(p_file, delimiter = ',', quotechar = '"')
+            self.header = read_header(p_reader)
+            for row in p_reader:
+                self.add_row(row)
+        self.byte_count = os.path.getsize(file_name)
+        self.parse_seconds = time.time() - start_time
+
+    def add_row(self, row):
+        row_count = len(self.row_lengths)
+        while len(self.columns) < len(row):
+            self.columns.append(array('i', [CONST_MISSING_CODE]) * row_count)
+        for column, value in zip(self.columns, row):
+            column.append(self.vocabulary.encode(value))
+        for column in self.columns[len(row):]:
+            column.append(CONST_MISSING_CODE)
+        self.row_lengths.append(len(row))
+
+    def get_row_count(self):
+        return len(self.row_lengths)
+
+    def get_rows(self):
+        strings = self.vocabulary.strings
+        if len(self.columns) == 0:
+            return
+        if min(self.row_lengths) == len(self.columns):
+            for codes in izip(*self.columns):
+                yield map(strings.__getitem__, codes)
+        else:
+            for row_length, codes in izip(self.row_lengths, izip(*self.columns)):
+                yield map(strings.__getitem__, codes[:row_length])
+
+    # Returns the codes of one column for every row. Like indexing the rows
+    # themselves, a negative index counts back from the end of each row and
+    # a row too short for the index raises IndexError.
+    def get_column(self, index):
+        if index >= 0 and len(self.row_lengths) > 0 and min(self.row_lengths) > index:
+            return self.columns[index]
+        key = ('column', index)
+        if key not in self.derived:
+            column = array('i')
+            for row_number, row_length in enumerate(self.row_lengths):
+                position = index
+                if index < 0:
+                    position = row_length + index
+                if position < 0 or position >= row_length:
+                    raise IndexError('row ' + str(row_number + 2) + ' has no column ' + str(index))
+                column.append(self.columns[position][row_number])
+            self.derived[key] = column
+        return self.derived[key]
+
+    # Returns one column converted to ints, raising ValueError on the first
+    # value that is not an integer.
+    def get_int_column(self, index):
+        key = ('int_column', index)
+        if key not in self.derived:
+            numbers = {}
+            column = array('l')
+            for code in self.get_column(index):
+                if code not in numbers:
+                    numbers[code] = int(self.vocabulary.decode(code))
+                column.append(numbers[code])
+            self.derived[key] = column
+        return self.derived[key]
+
+    # Sums an integer column over every distinct combination of codes in the
+    # key columns.
+    def sum_by_codes(self, key_indexes, value_index):
+        totals = defaultdict(int)
+        values = self.get_int_column(value_index)
+        for codes, value in izip(izip(*[self.get_column(index) for index in key_indexes]), values):
+            totals[codes] += value
+        return totals
+
+# Keeps one ParsedFile per path for the whole process. A file is parsed again
+# only when its modification time changes.
+class ParsedFileRegistry:
+
+    def __init__(self):
+        self.files = {}
+
+    def get_file(self, file_name):
+        path = os.path.abspath(file_name)
+        modified_time = os.path.getmtime(path)
+        parsed_file = self.files.get(path)
+        if parsed_file is None or parsed_file.modified_time != modified_time:
+            parsed_file = ParsedFile(path, modified_time)
+            self.files[path] = parsed_file
+        return parsed_file
+
+    # The header of a file, read from its first line unless the file is
+    # already parsed.
+    def get_header(self, file_name):
+        path = os.path.abspath(file_name)
+        parsed_file = self.files.get(path)
+        if parsed_file is not None and parsed_file.modified_time == os.path.getmtime(path):
+            return parsed_file.header
+        with open(file_name, 'rb') as h_file:
+            return read_header(csv.reader(h_file, delimiter = ',', quotechar = '"'))
+
+    def release(self, file_name):
+        self.files.pop(os.path.abspath(file_name), None)
+
+parsed_files = ParsedFileRegistry()
+
+class RowCheck:
+
+    def __init__(self, name, test_function):
+        self.name = name
+        self.test_function = test_function
+        self.error_count = 0
+
+    def process_row(self, row):
+        if self.test_function(row) == False:
+            self.error_count += 1
+
+    def get_error_count(self):
+        return self.error_count
+
+# Times a check row by row for a ValidationReport, running it under its own
+# profiler when one is given.
+class TimedCheck:
+
+    def __init__(self, check, profile=False):
+        self.check = check
+        self.name = check.name
+        self.seconds = 0.0
+        self.profiler = None
+        if profile:
+            self.profiler = cProfile.Profile()
+
+    def process_row(self, row):
+        start_time = time.time()
+        if self.profiler is not None:
+            self.profiler.runcall(self.check.process_row, row)
+        else:
+            self.check.process_row(row)
+        self.seconds += time.time() - start_time
+
+    def get_error_count(self):
+        return self.check.get_error_count()
+
+# Maps each candidate to the set of values it is listed with for every
+# attribute column, remembering the first file each value was seen in. Rows
+# can be added from several files, so conflicts between files show up too.
+class RelationshipIndex:
+
+    def __init__(self, attribute_names=('party', 'office', 'district')):
+        self.attribute_names = tuple(attribute_names)
+        self.relationships = dict((name, defaultdict(dict)) for name in self.attribute_names)
+
+    def add_value(self, attribute_name, key, value, source=None):
+        self.relationships[attribute_name][key].setdefault(value, source)
+
+    # Adds every row of a verifier's file, pairing the code columns of the
+    # file so each distinct candidate and value is only decoded once.
+    def add_file(self, verifier):
+        parsed_file = verifier.get_parsed_file()
+        keys = parsed_file.get_column(verifier.get_candidate_index())
+        for name in self.attribute_names:
+            values = parsed_file.get_column(verifier.get_column_index(name))
+            relationship = self.relationships[name]
+            for key, value in set(izip(keys, values)):
+                relationship[parsed_file.vocabulary.decode(key)].setdefault(parsed_file.vocabulary.decode(value),
+                                                                           verifier.file_name)
+
+    # Returns (key, [(value, source), ...]) for every key with more than one
+    # value for the attribute, sorted by key and value.
+    def get_conflicts(self, attribute_name):
+        conflicts = []
+        relationship = self.relationships[attribute_name]
+        for key in sorted(relationship):
+            if len(relationship[key]) > 1:
+                conflicts.append((key, sorted(relationship[key].items())))
+        return conflicts
+
+class RelationshipCheck:
+
+    def __init__(self, name, verbose, key_index, value_index, description):
+        self.name = name
+        self.verbose = verbose
+        self.key_index = key_index
+        self.value_index = value_index
+        self.description = description
+        self.relationship_index = RelationshipIndex([description])
+
+    def process_row(self, row):
+        self.relationship_index.add_value(self.description, row[self.key_index], row[self.value_index])
+
+    def get_error_count(self):
+        conflicts = self.relationship_index.get_conflicts(self.description)
+        if self.verbose:
+            for key, values in conflicts:
+                print key + ' is associated to multiple ' + self.description + ': ' + \
+                            str([value for value, source in values])
+        return len(conflicts)
+
 class VerifyBase:
 
-    def __init__(self, file_name, verbose, case):
+    def __init__(self, file_name, verbose, case, header=None):
         self.file_name = file_name
         self.verbose = verbose
         self.ignore_case = case
-        self.candidate_index = -1
-        self.party_index = -1
-        self.office_index = -1
-        self.district_index = -1
-        self.votes_index = -1
-        self.c_file = open(self.file_name, 'rb')
-        self.c_reader = csv.reader(self.c_file, delimiter = ',', quotechar = '"')
-        self.__calc_base_column_indexes()
+        self.parsed_file = None
+        if header is None:
+            header = parsed_files.get_header(self.file_name)
+        self.header = header
+        self.column_map = {}
+        self.candidate_index = self.get_column_index("candidate")
+        self.party_index = self.get_column_index("party")
+        self.office_index = self.get_column_index("office")
+        self.district_index = self.get_column_index("district")
+        self.votes_index = self.get_column_index("votes")
+
+    # The file is only parsed when its rows are first needed, so building a
+    # verifier for its header or for a cached clean result stays cheap.
+    def get_parsed_file(self):
+        if self.parsed_file is None:
+            self.parsed_file = parsed_files.get_file(self.file_name)
+        return self.parsed_file
+
+    # The data rows of the file, shared with every other verifier of the same file.
+    def get_rows(self):
+        return self.get_parsed_file().get_rows()
 
     def get_candidate_index(self):
         return self.candidate_index
@@ -145,6 +986,11 @@ class VerifyBase:
     def get_votes_index(self):
         return self.votes_index
 
+    def get_column_index(self, column_name):
+        if column_name not in self.column_map:
+            self.column_map[column_name] = self.find_header_index(column_name, self.header)
+        return self.column_map[column_name]
+
     def find_header_index(self, header_value, input_row):
         return_value = -1
         index = 0
@@ -158,20 +1004,6 @@ class VerifyBase:
             index += 1
         return return_value
 
-    def __calc_base_column_indexes(self):
-    
-        for row in self.c_reader:
-            if self.candidate_index == -1:
-                self.candidate_index = self.find_header_index("candidate", row)
-            if self.office_index == -1:
-                self.office_index = self.find_header_index("office", row)
-            if self.district_index == -1:
-                self.district_index = self.find_header_index("district", row)
-            if self.party_index == -1:
-                self.party_index = self.find_header_index("party", row)
-            if self.votes_index == -1:
-                self.votes_index = self.find_header_index("votes", row)
-
     def __verify_office_value(self, office_value):
         return_value = False
         if self.ignore_case:
@@ -223,119 +1055,91 @@ class VerifyBase:
                 print 'Invalid number found as a vote total [' + votes_value + ']'
         return return_value
 
-    def verify_offices(self):
-        office_errors = 0
-        self.c_file.seek(0)
-        for i, row in enumerate(self.c_reader):
-            if i > 0:
-                if self.__verify_office_value(row[self.get_office_index()]) == False:
-                    office_errors += 1
-        return office_errors
-
-    def verify_districts(self):
-        district_errors = 0
-        self.c_file.seek(0)
-        for i, row in enumerate(self.c_reader):
-            if i > 0:
-                if self.__verify_district_value(row[self.get_district_index()],
-                                                row[self.get_office_index()]) == False:
-                    district_errors += 1
-        return district_errors
-
-    def verify_votes(self):
-        votes_errors = 0
-        self.c_file.seek(0)
-        for i, row in enumerate(self.c_reader):
-            if i > 0:
-                if self.__verify_votes_value(row[self.get_votes_index()]) == False:
-                    votes_errors += 1
-        return votes_errors
-
-    def verify_candidate_district_relationship(self):
+    def get_check_names(self):
+        return [ 'offices',
+                 'districts',
+                 'votes',
+                 'candidate_party',
+                 'candidate_office',
+                 'candidate_district' ]
 
-        cand_district_dict = defaultdict(list)
-        error_count = 0
+    def create_check(self, check_name):
+        if check_name == 'offices':
+            return RowCheck(check_name,
+                            lambda row: self.__verify_office_value(row[self.get_office_index()]))
+        elif check_name == 'districts':
+            return RowCheck(check_name,
+                            lambda row: self.__verify_district_value(row[self.get_district_index()],
+                                                                     row[self.get_office_index()]))
+        elif check_name == 'votes':
+            return RowCheck(check_name,
+                            lambda row: self.__verify_votes_value(row[self.get_votes_index()]))
+        elif check_name == 'candidate_party':
+            return RelationshipCheck(check_name, self.verbose, self.get_candidate_index(),
+                                     self.get_party_index(), 'parties')
+        elif check_name == 'candidate_office':
+            return RelationshipCheck(check_name, self.verbose, self.get_candidate_index(),
+                                     self.get_office_index(), 'offices')
+        elif check_name == 'candidate_district':
+            return RelationshipCheck(check_name, self.verbose, self.get_candidate_index(),
+                                     self.get_district_index(), 'districts')
+        raise ValueError('Unknown check: ' + check_name)
 
-        self.c_file.seek(0)
-        for row in self.c_reader:
-           candidate = row[self.get_candidate_index()]
-           district = row[self.get_district_index()]
+    # Runs every requested check (all of them by default) in a single pass
+    # over the file and returns the error count of each check by name. With a
+    # ValidationCache, a file that already passed these checks is not read.
+    # With a ValidationReport, the run is timed and added to the report.
+    def verify_all(self, check_names=None, cache=None, report=None):
+        start_time = time.time()
+        if check_names is None:
+            check_names = self.get_check_names()
+        if cache is not None and cache.is_clean(self, check_names):
+            results = OrderedDict((check_name, 0) for check_name in check_names)
+            if report is not None:
+                report.add_file(self, results, time.time() - start_time)
+            return results
+        checks = [self.create_check(check_name) for check_name in check_names]
+        if report is not None:
+            checks = [TimedCheck(check, report.profile) for check in checks]
 
-           if candidate in cand_district_dict:
-               if district not in cand_district_dict[candidate]:
-                   cand_district_dict[candidate].append(district)
-           else:
-               cand_district_dict[candidate].append(district)
+        for row in self.get_rows():
+            for check in checks:
+                check.process_row(row)
 
-        for candidate in cand_district_dict:
-            if len(cand_district_dict[candidate]) > 1:
-                error_count += 1
-                if self.verbose:
-                    print candidate + ' is associated to multiple districts: ' + \
-                                      str(cand_district_dict[candidate])
-        return error_count
+        results = OrderedDict()
+        for check in checks:
+            results[check.name] = check.get_error_count()
+        if cache is not None:
+            cache.record(self, check_names, results)
+        if report is not None:
+            report.add_file(self, results, time.time() - start_time, checks)
+        return results
 
-    def verify_candidate_office_relationship(self):
+    def verify_offices(self):
+        return self.verify_all(['offices'])['offices']
 
-        cand_office_dict = defaultdict(list)
-        error_count = 0
+    def verify_districts(self):
+        return self.verify_all(['districts'])['districts']
 
-        self.c_file.seek(0)
-        for row in self.c_reader:
-           candidate = row[self.get_candidate_index()]
-           office = row[self.get_office_index()]
+    def verify_votes(self):
+        return self.verify_all(['votes'])['votes']
 
-           if candidate in cand_office_dict:
-               if office not in cand_office_dict[candidate]:
-                   cand_office_dict[candidate].append(office)
-           else:
-               cand_office_dict[candidate].append(office)
+    def verify_candidate_district_relationship(self):
+        return self.verify_all(['candidate_district'])['candidate_district']
 
-        for candidate in cand_office_dict:
-            if len(cand_office_dict[candidate]) > 1:
-                error_count += 1
-                if self.verbose:
-                    print candidate + ' is associated to multiple offices: ' + \
-                                      str(cand_office_dict[candidate])
-        return error_count
+    def verify_candidate_office_relationship(self):
+        return self.verify_all(['candidate_office'])['candidate_office']
 
     def verify_candidate_party_relationship(self):
-
-        cand_party_dict = defaultdict(list)
-        error_count = 0
-
-        self.c_file.seek(0)
-        for row in self.c_reader:
-           candidate = row[self.get_candidate_index()]
-           party = row[self.get_party_index()]
-
-           if candidate in cand_party_dict:
-               if party not in cand_party_dict[candidate]:
-                   cand_party_dict[candidate].append(party)
-           else:
-               cand_party_dict[candidate].append(party)
-
-        for candidate in cand_party_dict:
-            if len(cand_party_dict[candidate]) > 1:
-                error_count += 1
-                if self.verbose:
-                    print candidate + ' is associated to multiple parties: ' + \
-                                      str(cand_party_dict[candidate])
-        return error_count
+        return self.verify_all(['candidate_party'])['candidate_party']
 
 class VerifyCounty(VerifyBase):
 
-    def __init__ (self, file_name, verbose, ignore_case):
-        VerifyBase.__init__(self, file_name, verbose, ignore_case)
-        self.county_index = -1
-        self.__calc_county_column_indexes()
-
-    def __calc_county_column_indexes(self):
-   
-        self.c_file.seek(0)
-        for row in self.c_reader:
-            if self.county_index == -1:
-                self.county_index = self.find_header_index("county", row)
+    def __init__ (self, file_name, verbose, ignore_case, header=None):
+        VerifyBase.__init__(self, file_name, verbose, ignore_case, header)
+        self.county_index = self.get_column_index("county")
+        self.vote_totals = None
+        self.county_candidate_totals = None
 
     def __verify_county_value(self, county_value):
         return_value = False
@@ -353,78 +1157,178 @@ class VerifyCounty(VerifyBase):
     def get_county_index(self):
         return self.county_index
 
+    def get_check_names(self):
+        return ['counties'] + VerifyBase.get_check_names(self)
+
+    def create_check(self, check_name):
+        if check_name == 'counties':
+            return RowCheck(check_name,
+                            lambda row: self.__verify_county_value(row[self.get_county_index()]))
+        return VerifyBase.create_check(self, check_name)
+
     def verify_counties(self):
-        county_errors = 0
-        self.c_file.seek(0)
-        for i, row in enumerate(self.c_reader):
-            if i > 0:
-                if self.__verify_county_value(row[self.get_county_index()]) == False:
-                    county_errors += 1
-        return county_errors
+        return self.verify_all(['counties'])['counties']
 
-    def get_all_candidates_and_votes_by_county(self, in_county_name):
-        cand_vote_dict = defaultdict(int)
-
-        self.c_file.seek(0)
-        for i, row in enumerate(self.c_reader):
-           if i > 0:
-               county_name = row[self.get_county_index()]
-               candidate = row[self.get_candidate_index()]
-               votes = int(row[self.get_votes_index()])
-
-               if county_name == in_county_name:
-                   if candidate in cand_vote_dict:
-                       cand_vote_dict[candidate] += votes
-                   else:
-                       cand_vote_dict[candidate] = votes
-
-        return cand_vote_dict
-        
-    def get_candidates_votes_by_county(self, in_county_name, in_candidate_name):
+    # Builds the (county, office, district, candidate) -> votes index on the
+    # first query so later lookups don't have to rescan the file. The index
+    # is kept with the parsed file, so other verifiers of the file reuse it.
+    def __build_vote_totals(self):
+        index_key = ('vote_totals', self.get_county_index(), self.get_office_index(),
+                     self.get_district_index(), self.get_candidate_index(), self.get_votes_index())
+        if index_key in self.get_parsed_file().derived:
+            self.vote_totals, self.county_candidate_totals = self.get_parsed_file().derived[index_key]
+            return
 
-        return_value = 0
+        self.vote_totals = defaultdict(int)
+        self.county_candidate_totals = defaultdict(lambda: defaultdict(int))
 
-        self.c_file.seek(0)
-        for i, row in enumerate(self.c_reader):
-            if i > 0:
-               county_name = row[self.get_county_index()]
-               candidate = row[self.get_candidate_index()]
-               votes = int(row[self.get_votes_index()])
+        code_totals = self.get_parsed_file().sum_by_codes(index_key[1:5], self.get_votes_index())
+        decode = self.get_parsed_file().vocabulary.decode
+        for codes, votes in code_totals.iteritems():
+            county_name, office, district, candidate = [decode(code) for code in codes]
+            self.vote_totals[(county_name, office, district, candidate)] += votes
+            self.county_candidate_totals[county_name][candidate] += votes
 
-               if county_name == in_county_name and candidate == in_candidate_name:
-                   return_value += votes                
+        self.get_parsed_file().derived[index_key] = (self.vote_totals, self.county_candidate_totals)
 
-        return return_value
+    def get_vote_totals(self):
+        if self.vote_totals is None:
+            self.__build_vote_totals()
+        return self.vote_totals
 
-class VerifyMuni(VerifyCounty):
+    def get_votes(self, in_county_name, in_office, in_district, in_candidate_name):
+        return self.get_vote_totals().get((in_county_name, in_office, in_district, in_candidate_name), 0)
+
+    # Sums votes by the named columns. Keys made only of index columns are
+    # rolled up from the vote index, anything else is summed over the code
+    # columns of the file. candidate_map, when given, translates candidate
+    # names while grouping; labels, when given, is filled with the key as
+    # spelled in the file for every grouped key it doesn't already have.
+    def group_votes(self, key_names, counties=None, candidate_map=None, labels=None):
+        grouped_votes = defaultdict(int)
+        for key_name in key_names:
+            if self.get_column_index(key_name) == -1:
+                raise ValueError('no ' + key_name + ' column in ' + self.file_name)
 
-    def __init__ (self, file_name, verbose, ignore_case):
-        VerifyCounty.__init__(self, file_name, verbose, ignore_case)
-        self.muni_index = -1
-        self.__calc_muni_column_indexes()
+        if all(key_name in CONST_VOTE_INDEX_KEYS for key_name in key_names):
+            positions = [CONST_VOTE_INDEX_KEYS.index(key_name) for key_name in key_names]
+            for index_key, votes in self.get_vote_totals().iteritems():
+                if counties is None or index_key[0] in counties:
+                    label = tuple(index_key[p] for p in positions)
+                    if candidate_map is not None:
+                        index_key = index_key[:3] + (candidate_map(index_key[3]),)
+                    key = tuple(index_key[p] for p in positions)
+                    grouped_votes[key] += votes
+                    if labels is not None:
+                        labels.setdefault(key, label)
+        else:
+            column_indexes = [self.get_column_index(key_name) for key_name in key_names]
+            code_totals = self.get_parsed_file().sum_by_codes(column_indexes + [self.get_county_index()],
+                                                        self.get_votes_index())
+            decode = self.get_parsed_file().vocabulary.decode
+            for codes, votes in code_totals.iteritems():
+                if counties is None or decode(codes[-1]) in counties:
+                    label = tuple(decode(code) for code in codes[:-1])
+                    key = label
+                    if candidate_map is not None:
+                        key = tuple(candidate_map(value) if column_index == self.get_candidate_index() else value
+                                    for value, column_index in zip(label, column_indexes))
+                    grouped_votes[key] += votes
+                    if labels is not None:
+                        labels.setdefault(key, label)
 
-    def __calc_muni_column_indexes(self):
-        self.c_file.seek(0)
-        for row in self.c_reader:
-            if self.muni_index == -1:
-                self.muni_index = self.find_header_index("municipality", row)
+        return grouped_votes
+
+    def get_all_candidates_and_votes_by_county(self, in_county_name):
+        self.get_vote_totals()
+        return defaultdict(int, self.county_candidate_totals.get(in_county_name, {}))
         
+    def get_candidates_votes_by_county(self, in_county_name, in_candidate_name):
+        self.get_vote_totals()
+        return self.county_candidate_totals.get(in_county_name, {}).get(in_candidate_name, 0)
+
+class VerifyMuni(VerifyCounty):
+
+    def __init__ (self, file_name, verbose, ignore_case, header=None):
+        VerifyCounty.__init__(self, file_name, verbose, ignore_case, header)
+        self.muni_index = self.get_column_index("municipality")
+
     def get_muni_index(self):
         return self.muni_index
 
 class VerifyPrecinct(VerifyCounty):
 
-    def __init__ (self, file_name, verbose, ignore_case):
-        VerifyCounty.__init__(self, file_name, verbose, ignore_case)
-        self.precinct_index = -1
-        self.__calc_precinct_column_indexes()
+    def __init__ (self, file_name, verbose, ignore_case, header=None):
+        VerifyCounty.__init__(self, file_name, verbose, ignore_case, header)
+        self.precinct_index = self.get_column_index("precinct")
 
-    def __calc_precinct_column_indexes(self):
-        self.c_file.seek(0)
-        for row in self.c_reader:
-            if self.precinct_index == -1:
-                self.precinct_index = self.find_header_index("precinct", row)
-        
     def get_precinct_index(self):
         return self.precinct_index
 
+# Rolls the results files of one election up the precinct -> municipal ->
+# county levels. Every file is grouped once by key_names, then reconciled
+# against the nearest file above it that covers its county: a statewide file
+# of the same level first, then the next level up, preferring a file for the
+# same county over a statewide one. Files that cannot be grouped are left
+# out of the roll-up and their children move on to the next file up.
+class ElectionRollup:
+
+    def __init__(self, election_files, key_names=('county', 'candidate'), verbose=False, ignore_case=False,
+                 candidate_map=None):
+        if 'county' not in key_names:
+            raise ValueError('roll-up keys must include county')
+        self.key_names = tuple(key_names)
+        self.county_position = self.key_names.index('county')
+        self.nodes = OrderedDict()
+        self.failures = []
+
+        for file_name, county_name, level in sorted(election_files, key=lambda f: (f[2], f[1], f[0])):
+            node = (level, county_name)
+            if node in self.nodes:
+                self.failures.append((file_name, 'another ' + level + ' file covers the same county'))
+                continue
+            try:
+                verifier = VerifyCounty(file_name, verbose, ignore_case)
+                labels = {}
+                self.nodes[node] = (file_name, verifier.group_votes(self.key_names, None, candidate_map, labels),
+                                    labels)
+            except (ValueError, IndexError) as e:
+                self.failures.append((file_name, str(e)))
+
+    def find_parent(self, level, county_name):
+        parents = []
+        if county_name is not None:
+            parents.append((level, None))
+        for upper_level in reversed(CONST_LEVELS[:CONST_LEVELS.index(level)]):
+            if county_name is not None:
+                parents.append((upper_level, county_name))
+            parents.append((upper_level, None))
+        for parent in parents:
+            if parent in self.nodes:
+                return parent
+        return None
+
+    def county_votes(self, votes, county_name):
+        if county_name is None:
+            return votes
+        return dict((key, value) for key, value in votes.iteritems() if key[self.county_position] == county_name)
+
+    # Returns (lower file, lower level, upper file, upper level, mismatches)
+    # for every file that has a file above it, top level first.
+    def reconcile(self):
+        results = []
+        for level in CONST_LEVELS:
+            for node_level, county_name in self.nodes:
+                if node_level != level:
+                    continue
+                parent = self.find_parent(level, county_name)
+                if parent is None:
+                    continue
+                lower_file, lower_votes, lower_labels = self.nodes[(level, county_name)]
+                upper_file, upper_votes, upper_labels = self.nodes[parent]
+                labels = dict(lower_labels)
+                labels.update(upper_labels)
+                mismatches = compare_votes(self.county_votes(upper_votes, county_name),
+                                           self.county_votes(lower_votes, county_name), True, labels)
+                results.append((lower_file, level, upper_file, parent[0], mismatches))
+        return results
@@ -0,0 +1,79 @@
+#!/usr/bin/python
+#
+# MIT License
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+import sys
+import argparse
+from nj_common import *
+
+def main():
+
+    args = handle_arguments()
+    elections = group_files_by_election(find_results_files(args.root))
+
+    error_count = 0
+    for election in sorted(elections):
+        error_count += reconcile_election(args, election, elections[election])
+
+    print "There are " + str(error_count) + " vote totals that are not reconciled."
+
+def handle_arguments():
+    arg_parser = argparse.ArgumentParser(description='Reconcile New Jersey county totals against municipal and precinct files')
+    arg_parser.add_argument('--verbose', '-v', dest='verbose',  help='report information verbosely', action='store_true')
+    arg_parser.add_argument('--case', '-c', dest='case',  help='case sensitive text compare', action='store_true')
+    arg_parser.add_argument('--key', '-k', dest='key', default='county,candidate', help='comma separated columns to reconcile on')
+    arg_parser.add_argument('--include-lower-only', dest='include_lower_only', help='also report keys found only in the lower level file', action='store_true')
+    arg_parser.add_argument('--root', '-r', dest='root', default='..', help='directory holding the year directories')
+    return arg_parser.parse_args()
+
+def reconcile_election(args, election, election_files):
+
+    error_count = 0
+    key_names = tuple(args.key.split(','))
+
+    county_files = [f for f, county_name, level in election_files if level == 'county' and county_name is None]
+    if len(county_files) != 1:
+        return error_count
+
+    cv = VerifyCounty(county_files[0], args.verbose, args.case)
+    for lower_file, county_name, level in election_files:
+        if lower_file == county_files[0]:
+            continue
+        counties = CONST_COUNTIES
+        if county_name is not None:
+            counties = [county_name]
+
+        try:
+            lv = VerifyCounty(lower_file, args.verbose, args.case)
+            mismatches = reconcile_votes(cv, lv, key_names, counties, include_lower_only=args.include_lower_only)
+        except (ValueError, IndexError) as e:
+            print ' ... could not reconcile ' + lower_file + ': ' + str(e)
+            continue
+
+        lower_count = report_mismatches(mismatches, 'County', level.capitalize(), args.verbose)
+        print ' ... ' + str(lower_count) + ' unreconciled totals in ' + lower_file
+        error_count += lower_count
+
+    return error_count
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/python
+#
+# MIT License
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+
+import sys
+import argparse
+from nj_common import *
+
+def main():
+
+    args = handle_arguments()
+    elections = group_files_by_election(find_results_files(args.root))
+
+    candidate_map = None
+    if args.alias_file is not None:
+        candidate_map = CandidateAliases(args.alias_file).canonical_name
+
+    error_count = 0
+    for election in sorted(elections):
+        if len(args.elections) > 0 and not any(election.startswith(prefix) for prefix in args.elections):
+            continue
+        error_count += rollup_election(args, election, elections[election], candidate_map)
+
+    print "There are " + str(error_count) + " vote totals that are not reconciled."
+
+def handle_arguments():
+    arg_parser = argparse.ArgumentParser(description='Roll New Jersey precinct, municipal and county files up and reconcile every level')
+    arg_parser.add_argument('elections', nargs='*', help='election dates or prefixes such as 20141104 or 20161108__nj__general (default: all)')
+    arg_parser.add_argument('--verbose', '-v', dest='verbose',  help='report information verbosely', action='store_true')
+    arg_parser.add_argument('--case', '-c', dest='case',  help='case sensitive text compare', action='store_true')
+    arg_parser.add_argument('--key', '-k', dest='key', default='county,candidate', help='comma separated columns to reconcile on')
+    arg_parser.add_argument('--alias-file', '-a', dest='alias_file', help='CSV of candidate aliases to apply at every level')
+    arg_parser.add_argument('--root', '-r', dest='root', default='..', help='directory holding the year directories')
+    return arg_parser.parse_args()
+
+def rollup_election(args, election, election_files, candidate_map):
+
+    error_count = 0
+    rollup = ElectionRollup(election_files, args.key.split(','), args.verbose, args.case, candidate_map)
+    results = rollup.reconcile()
+    if len(results) == 0 and len(rollup.failures) == 0:
+        return error_count
+
+    print election + ':'
+    for file_name, failure in rollup.failures:
+        print ' ... could not roll up ' + file_name + ': ' + failure
+
+    for lower_file, lower_level, upper_file, upper_level, mismatches in results:
+        lower_count = report_mismatches(mismatches, upper_level.capitalize(), lower_level.capitalize(), args.verbose)
+        print ' ... ' + str(lower_count) + ' unreconciled totals in ' + lower_file + ' against ' + upper_file
+        error_count += lower_count
+
+    return error_count
+
+if __name__ == '__main__':
+    main()
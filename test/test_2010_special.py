@@ -31,6 +31,7 @@ def main():
 
     CONST_COUNTY_FILE = '../2010/20101104__nj__special__general.csv'
     CONST_MUNI_FILE = '../2010/20101104__nj__special__general__municipal.csv'
+    CONST_SPOT_CHECK_FILE = 'spot_checks/2010_special.csv'
 
     args = handle_arguments()
     process_county_file(args, CONST_COUNTY_FILE)
@@ -38,7 +39,7 @@ def main():
     compare_county_and_muni_totals(args, 
                                    CONST_COUNTY_FILE,
                                    CONST_MUNI_FILE)
-    spot_check_totals(args, CONST_COUNTY_FILE)
+    spot_check_totals(args, CONST_COUNTY_FILE, CONST_SPOT_CHECK_FILE)
 
 def handle_arguments():
     arg_parser = argparse.ArgumentParser(description='Validate New Jersey 2010 Special Election county and muni data')
@@ -51,13 +52,7 @@ def process_county_file(args, in_file):
     error_count = 0
 
     verifier = VerifyCounty(in_file, args.verbose, args.case)   
-    error_count += verifier.verify_counties()
-    error_count += verifier.verify_offices()
-    error_count += verifier.verify_districts()
-    error_count += verifier.verify_votes()
-    error_count += verifier.verify_candidate_party_relationship()
-    error_count += verifier.verify_candidate_office_relationship()
-    error_count += verifier.verify_candidate_district_relationship()
+    error_count += sum(verifier.verify_all().values())
 
     print 'There were ' + str(error_count) + ' invalid values in the County File.'
 
@@ -68,13 +63,7 @@ def process_muni_file(args, in_file):
     error_count = 0
 
     verifier = VerifyMuni(in_file, args.verbose, args.case)   
-    error_count += verifier.verify_counties()
-    error_count += verifier.verify_offices()
-    error_count += verifier.verify_districts()
-    error_count += verifier.verify_votes()
-    error_count += verifier.verify_candidate_party_relationship()
-    error_count += verifier.verify_candidate_office_relationship()
-    error_count += verifier.verify_candidate_district_relationship()
+    error_count += sum(verifier.verify_all().values())
 
     print 'There were ' + str(error_count) + ' invalid values in the Municipality File.'
 
@@ -82,55 +71,21 @@ def process_muni_file(args, in_file):
 
 def compare_county_and_muni_totals(args, county_file, muni_file):
 
-    error_count = 0
-
     cv = VerifyCounty(county_file, args.verbose, args.case)
     mv = VerifyMuni(muni_file, args.verbose, args.case)
 
+    error_count = 0
     for county_name in CONST_COUNTIES:
         print ' ... processing ' + county_name + ' County'
-        county_votes = cv.get_all_candidates_and_votes_by_county(county_name)
-        for cand in county_votes:
-            muni_total = mv.get_candidates_votes_by_county(county_name, cand)
-            if muni_total != county_votes[cand]:
-                error_count += 1
-                if args.verbose:
-                    print "Total votes are different in County (" + \
-                          str(county_votes[cand]) + ") and Municipal (" + \
-                          str(muni_total) + ") for " + cand + " in " + \
-                          county_name + " County."
+        mismatches = reconcile_votes(cv, mv, ('county', 'candidate'), [county_name])
+        error_count += report_mismatches(mismatches, 'County', 'Municipal', args.verbose)
 
     print "There are " + str(error_count) + " vote totals that are not reconciled."
 
-def spot_check_value(args, county_verifier, candidate_name, county_name, total_votes):
-
-    error_count = 1
-
-    vote_calc =  county_verifier.get_candidates_votes_by_county(county_name, candidate_name)
-    if vote_calc == total_votes:
-        error_count = 0
-    else:
-        if args.verbose:
-            print candidate_name + ' / ' + county_name + ' value is ' + str(vote_calc) + \
-                  '  ---  Expected value: ' + str(total_votes)
-
-    return error_count
-
-def spot_check_totals(args, county_file):
-
-    error_count = 0
+def spot_check_totals(args, county_file, manifest_file):
 
     cv = VerifyCounty(county_file, args.verbose, args.case)
-
-    ### Spot check at least one value from each input file
-    error_count += spot_check_value(args, cv, 'Donald W. Norcross', 'Camden', 22464)
-    error_count += spot_check_value(args, cv, 'Christopher J. Weag', 'Gloucester', 453)
-    error_count += spot_check_value(args, cv, 'Linda R. Greenstein', 'Mercer', 17289)
-    error_count += spot_check_value(args, cv, 'Thomas Goodwin', 'Middlesex', 14734)
-    error_count += spot_check_value(args, cv, 'Gilbert \'Whip\' Wilson', 'Camden', 22825)
-    error_count += spot_check_value(args, cv, 'Barbara A. Gallagher', 'Gloucester', 5681)
-    error_count += spot_check_value(args, cv, 'Jason O\'Donnell', 'Hudson', 19492)
-    error_count += spot_check_value(args, cv, 'Robert Mays', 'Hudson', 2516)
+    error_count = run_spot_checks(cv, load_spot_checks(manifest_file), args.verbose)
 
     print "There are " + str(error_count) + " Spot Check errors"
 
@@ -31,6 +31,7 @@ def main():
 
     CONST_COUNTY_FILE = '../2012/20121106__nj__general.csv'
     CONST_MUNI_FILE = '../2012/20121106__nj__general__municipal.csv'
+    CONST_SPOT_CHECK_FILE = 'spot_checks/2012_general.csv'
 
     args = handle_arguments()
     process_county_file(args, CONST_COUNTY_FILE)
@@ -38,7 +39,7 @@ def main():
     compare_county_and_muni_totals(args, 
                                    CONST_COUNTY_FILE,
                                    CONST_MUNI_FILE)
-    spot_check_totals(args, CONST_COUNTY_FILE)
+    spot_check_totals(args, CONST_COUNTY_FILE, CONST_SPOT_CHECK_FILE)
 
 def handle_arguments():
     arg_parser = argparse.ArgumentParser(description='Validate New Jersey 2012 General Election county and muni data')
@@ -51,13 +52,7 @@ def process_county_file(args, in_file):
     error_count = 0
 
     verifier = VerifyCounty(in_file, args.verbose, args.case)   
-    error_count += verifier.verify_counties()
-    error_count += verifier.verify_offices()
-    error_count += verifier.verify_districts()
-    error_count += verifier.verify_votes()
-    error_count += verifier.verify_candidate_party_relationship()
-    error_count += verifier.verify_candidate_office_relationship()
-    error_count += verifier.verify_candidate_district_relationship()
+    error_count += sum(verifier.verify_all().values())
 
     print 'There were ' + str(error_count) + ' invalid values in the County File.'
 
@@ -68,13 +63,7 @@ def process_muni_file(args, in_file):
     error_count = 0
 
     verifier = VerifyMuni(in_file, args.verbose, args.case)   
-    error_count += verifier.verify_counties()
-    error_count += verifier.verify_offices()
-    error_count += verifier.verify_districts()
-    error_count += verifier.verify_votes()
-    error_count += verifier.verify_candidate_party_relationship()
-    error_count += verifier.verify_candidate_office_relationship()
-    error_count += verifier.verify_candidate_district_relationship()
+    error_count += sum(verifier.verify_all().values())
 
     print 'There were ' + str(error_count) + ' invalid values in the Municipality File.'
 
@@ -82,122 +71,21 @@ def process_muni_file(args, in_file):
 
 def compare_county_and_muni_totals(args, county_file, muni_file):
 
-    error_count = 0
-
     cv = VerifyCounty(county_file, args.verbose, args.case)
     mv = VerifyMuni(muni_file, args.verbose, args.case)
 
+    error_count = 0
     for county_name in CONST_COUNTIES:
         print ' ... processing ' + county_name + ' County'
-        county_votes = cv.get_all_candidates_and_votes_by_county(county_name)
-        for cand in county_votes:
-            muni_total = mv.get_candidates_votes_by_county(county_name, cand)
-            if muni_total != county_votes[cand]:
-                error_count += 1
-                if args.verbose:
-                    print "Total votes are different in County (" + \
-                          str(county_votes[cand]) + ") and Municipal (" + \
-                          str(muni_total) + ") for " + cand + " in " + \
-                          county_name + " County."
+        mismatches = reconcile_votes(cv, mv, ('county', 'candidate'), [county_name])
+        error_count += report_mismatches(mismatches, 'County', 'Municipal', args.verbose)
 
     print "There are " + str(error_count) + " vote totals that are not reconciled."
 
-def spot_check_value(args, county_verifier, candidate_name, county_name, total_votes):
-
-    error_count = 1
-
-    vote_calc =  county_verifier.get_candidates_votes_by_county(county_name, candidate_name)
-    if vote_calc == total_votes:
-        error_count = 0
-    else:
-        if args.verbose:
-            print candidate_name + ' / ' + county_name + ' value is ' + str(vote_calc) + \
-                  '  ---  Expected value: ' + str(total_votes)
-
-    return error_count
-
-def spot_check_totals(args, county_file):
-
-    error_count = 0
+def spot_check_totals(args, county_file, manifest_file):
 
     cv = VerifyCounty(county_file, args.verbose, args.case)
-
-    ### Spot check at least one value from each input file
-    error_count += spot_check_value(args, cv, 'Robert Menendez', 'Atlantic', 61464)
-    error_count += spot_check_value(args, cv, 'Joe Kyrillos', 'Bergen', 144709)
-    error_count += spot_check_value(args, cv, 'Kenneth R. Kaplan', 'Burlington', 594)
-    error_count += spot_check_value(args, cv, 'Ken Wolski', 'Camden', 1228)
-    error_count += spot_check_value(args, cv, 'Gwen Diakos', 'Cape May', 116)
-    error_count += spot_check_value(args, cv, 'J. David Dranikoff', 'Cumberland', 246)
-    error_count += spot_check_value(args, cv, "Inder 'Andy' Soni", 'Cumberland', 97)
-    error_count += spot_check_value(args, cv, "Robert 'Turk' Turkavage", 'Essex', 215)
-    error_count += spot_check_value(args, cv, 'Gregory Pason', 'Gloucester', 42)
-    error_count += spot_check_value(args, cv, 'Eugene Martin Lavergne', 'Hudson', 197)
-    error_count += spot_check_value(args, cv, 'Daryl Mikell Brooks', 'Hunterdon', 45)
-    error_count += spot_check_value(args, cv, 'Robert Menendez', 'Mercer', 97964)
-    error_count += spot_check_value(args, cv, 'Joe Kyrillos', 'Middlesex', 97730)
-    error_count += spot_check_value(args, cv, 'Kenneth R. Kaplan', 'Monmouth', 1291)
-    error_count += spot_check_value(args, cv, 'Ken Wolski', 'Morris', 513)
-    error_count += spot_check_value(args, cv, 'Gwen Diakos', 'Ocean', 689)
-    error_count += spot_check_value(args, cv, 'J. David Dranikoff', 'Passaic', 120)
-    error_count += spot_check_value(args, cv, "Inder 'Andy' Soni", 'Somerset', 173)
-    error_count += spot_check_value(args, cv, "Robert 'Turk' Turkavage", 'Salem', 45)
-    error_count += spot_check_value(args, cv, 'Gregory Pason', 'Sussex', 77)
-    error_count += spot_check_value(args, cv, 'Eugene Martin Lavergne', 'Union', 29)
-    error_count += spot_check_value(args, cv, 'Daryl Mikell Brooks', 'Warren', 41)
-    error_count += spot_check_value(args, cv, 'Kenneth R. Kaplan', 'Warren', 229)
-    error_count += spot_check_value(args, cv, 'Ken Wolski', 'Union', 490)
-    error_count += spot_check_value(args, cv, 'Gwen Diakos', 'Sussex', 1050)
-    error_count += spot_check_value(args, cv, 'J. David Dranikoff', 'Somerset', 188)
-    error_count += spot_check_value(args, cv, "Inder 'Andy' Soni", 'Salem', 70)
-    error_count += spot_check_value(args, cv, "Robert 'Turk' Turkavage", 'Passaic', 115)
-    error_count += spot_check_value(args, cv, 'Gregory Pason', 'Ocean', 120)
-    error_count += spot_check_value(args, cv, 'Eugene Martin Lavergne', 'Morris', 34)
-    error_count += spot_check_value(args, cv, 'Daryl Mikell Brooks', 'Monmouth', 143)
-    error_count += spot_check_value(args, cv, 'Robert Menendez', 'Middlesex', 178686)
-    error_count += spot_check_value(args, cv, 'Joe Kyrillos', 'Mercer', 43793)
-    error_count += spot_check_value(args, cv, 'Kenneth R. Kaplan', 'Hunterdon', 660)
-    error_count += spot_check_value(args, cv, 'Ken Wolski', 'Hudson', 1395)
-    error_count += spot_check_value(args, cv, 'Gwen Diakos', 'Gloucester', 152)
-    error_count += spot_check_value(args, cv, 'J. David Dranikoff', 'Essex', 225)
-    error_count += spot_check_value(args, cv, "Inder 'Andy' Soni", 'Cape May', 98)
-    error_count += spot_check_value(args, cv, "Robert 'Turk' Turkavage", 'Camden', 178)
-    error_count += spot_check_value(args, cv, 'Gregory Pason', 'Burlington', 70)
-    error_count += spot_check_value(args, cv, 'Eugene Martin Lavergne', 'Bergen', 85)
-    error_count += spot_check_value(args, cv, 'Daryl Mikell Brooks', 'Atlantic', 89)
-    error_count += spot_check_value(args, cv, 'Rush Holt', 'Middlesex', 71597)
-    error_count += spot_check_value(args, cv, 'John Arvanites', 'Morris', 55873)
-    error_count += spot_check_value(args, cv, 'Joanne Miller', 'Hudson', 819)
-    error_count += spot_check_value(args, cv, 'Jeanette Woolsey', 'Bergen', 733)
-    error_count += spot_check_value(args, cv, 'Albio Sires', 'Hudson', 85092)
-    error_count += spot_check_value(args, cv, 'Upendra J. Chivukula', 'Hunterdon', 20044)
-    error_count += spot_check_value(args, cv, 'Len Flynn', 'Middlesex', 970)
-    error_count += spot_check_value(args, cv, 'Patricia Alessandrini', 'Bergen', 4051)
-    error_count += spot_check_value(args, cv, 'Christopher H. Smith', 'Monmouth', 109506)
-    error_count += spot_check_value(args, cv, 'Shelley Adler', 'Ocean', 51331)
-    error_count += spot_check_value(args, cv, 'John Ordille', 'Salem', 366)
-    error_count += spot_check_value(args, cv, 'Gregory W. Horton', 'Camden', 56670)
-    error_count += spot_check_value(args, cv, 'Barack Obama','Atlantic',65600)
-    error_count += spot_check_value(args, cv, 'Mitt Romney','Bergen', 169070)
-    error_count += spot_check_value(args, cv, 'Gary Johnson','Burlington', 1367)
-    error_count += spot_check_value(args, cv, 'Jill Stein','Camden', 697)
-    error_count += spot_check_value(args, cv, 'Virgil Goode','Cape May', 90)
-    error_count += spot_check_value(args, cv, 'Ross C. (Rocky) Anderson','Cumberland', 62)
-    error_count += spot_check_value(args, cv, 'Jeff Boss','Essex', 118)
-    error_count += spot_check_value(args, cv, 'James Harris','Gloucester', 14)
-    error_count += spot_check_value(args, cv, 'Merlin Miller','Hudson', 20)
-    error_count += spot_check_value(args, cv, 'Peta Lindsay','Hunterdon', 11)
-    error_count += spot_check_value(args, cv, 'Barack Obama','Mercer', 104377)
-    error_count += spot_check_value(args, cv, 'Mitt Romney','Middlesex', 107310)
-    error_count += spot_check_value(args, cv, 'Gary Johnson','Monmouth', 2228)
-    error_count += spot_check_value(args, cv, 'Jill Stein','Morris', 485)
-    error_count += spot_check_value(args, cv, 'Virgil Goode','Ocean', 100)
-    error_count += spot_check_value(args, cv, 'Ross C. (Rocky) Anderson','Passaic', 68)
-    error_count += spot_check_value(args, cv, 'Jeff Boss','Salem', 2)
-    error_count += spot_check_value(args, cv, 'James Harris','Somerset', 75)
-    error_count += spot_check_value(args, cv, 'Merlin Miller','Sussex', 26)
-    error_count += spot_check_value(args, cv, 'Peta Lindsay','Union', 19)
-    error_count += spot_check_value(args, cv, 'Barack Obama','Warren', 18745)
+    error_count = run_spot_checks(cv, load_spot_checks(manifest_file), args.verbose)
 
     print "There are " + str(error_count) + " Spot Check errors"
 
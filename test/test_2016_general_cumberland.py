@@ -50,13 +50,7 @@ def process_precinct_file(args, in_file):
     error_count = 0
 
     verifier = VerifyMuni(in_file, args.verbose, args.case)   
-    error_count += verifier.verify_counties()
-    error_count += verifier.verify_offices()
-    error_count += verifier.verify_districts()
-    error_count += verifier.verify_votes()
-    error_count += verifier.verify_candidate_party_relationship()
-    error_count += verifier.verify_candidate_office_relationship()
-    error_count += verifier.verify_candidate_district_relationship()
+    error_count += sum(verifier.verify_all().values())
 
     print 'There were ' + str(error_count) + ' invalid values in the Precinct File.'
 
@@ -64,25 +58,13 @@ def process_precinct_file(args, in_file):
 
 def compare_county_and_precinct_totals(args, county_file, precinct_file):
 
-    error_count = 0
-
     cv = VerifyCounty(county_file, args.verbose, args.case)
     mv = VerifyPrecinct(precinct_file, args.verbose, args.case)
+    aliases = CandidateAliases()
 
-    county_name = 'Cumberland'
-    county_votes = cv.get_all_candidates_and_votes_by_county(county_name)
-    for cand in county_votes:
-        if cand == 'Rocky Roque De la Fuente':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'Rocky Roque De La Fuente')
-        else:
-            muni_total = mv.get_candidates_votes_by_county(county_name, cand)
-        if muni_total != county_votes[cand]:
-            error_count += 1
-            if args.verbose:
-                print "Total votes are different in County (" + \
-                      str(county_votes[cand]) + ") and Precinct (" + \
-                      str(muni_total) + ") for " + cand + " in " + \
-                      county_name + " County."
+    mismatches = reconcile_votes(cv, mv, ('county', 'candidate'), ['Cumberland'],
+                                 aliases.canonical_name, include_lower_only=False)
+    error_count = report_mismatches(mismatches, 'County', 'Precinct', args.verbose)
 
     print "There are " + str(error_count) + " vote totals that are not reconciled."
 
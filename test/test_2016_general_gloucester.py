@@ -50,13 +50,7 @@ def process_precinct_file(args, in_file):
     error_count = 0
 
     verifier = VerifyMuni(in_file, args.verbose, args.case)   
-    error_count += verifier.verify_counties()
-    error_count += verifier.verify_offices()
-    error_count += verifier.verify_districts()
-    error_count += verifier.verify_votes()
-    error_count += verifier.verify_candidate_party_relationship()
-    error_count += verifier.verify_candidate_office_relationship()
-    error_count += verifier.verify_candidate_district_relationship()
+    error_count += sum(verifier.verify_all().values())
 
     print 'There were ' + str(error_count) + ' invalid values in the Precinct File.'
 
@@ -64,65 +58,13 @@ def process_precinct_file(args, in_file):
 
 def compare_county_and_precinct_totals(args, county_file, precinct_file):
 
-    error_count = 0
-
     cv = VerifyCounty(county_file, args.verbose, args.case)
     mv = VerifyPrecinct(precinct_file, args.verbose, args.case)
+    aliases = CandidateAliases()
 
-    county_name = 'Gloucester'
-    county_votes = cv.get_all_candidates_and_votes_by_county(county_name)
-    for cand in county_votes:
-        if cand == 'Hillary Rodham Clinton':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'HILLARY RODHAM CLINTON')
-        elif cand == 'Donald J. Trump':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'DONALD J. TRUMP')
-        elif cand == 'Monica Moorehead':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'MONICA MOOREHEAD')
-        elif cand == 'Darrell Castle':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'DARRELL CASTLE')
-        elif cand == 'Alyson Kennedy':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'ALYSON KENNEDY')
-        elif cand == 'Jill Stein':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'JILL STEIN')
-        elif cand == 'Gloria La Riva':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'GLORIA LA RIVA')
-        elif cand == 'Gary Johnson':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'GARY JOHNSON')
-        elif cand == 'Bob Patterson':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'BOB PATTERSON')
-        elif cand == 'Donald W. Norcross':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'DONALD W. NORCROSS')
-        elif cand == 'Scot John Tomaszewski':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'SCOT JOHN TOMASZEWSKI')
-        elif cand == 'Michael Berman':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'MICHAEL BERMAN')
-        elif cand == 'William F. Sihr IV':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'WILLIAM F. SIHR IV')
-        elif cand == 'Frank A. LoBiondo':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'FRANK A. LOBIONDO')
-        elif cand == 'David H. Cole':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'DAVID H. COLE')
-        elif cand == 'Eric Beechwood':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'ERIC BEECHWOOD')
-        elif cand == 'Steven Fenichel':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'STEVEN FENICHEL')
-        elif cand == 'James Keenan':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'JAMES KEENAN')
-        elif cand == 'Gabriel Brian Franco':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'GABRIEL BRIAN FRANCO')
-        elif cand == 'John Ordille':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'JOHN ORDILLE')
-        elif cand == 'Rocky Roque De la Fuente':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'ROCKY ROQUE DE LA FUENTE')
-        else:
-            muni_total = mv.get_candidates_votes_by_county(county_name, cand)
-        if muni_total != county_votes[cand]:
-            error_count += 1
-            if args.verbose:
-                print "Total votes are different in County (" + \
-                      str(county_votes[cand]) + ") and Precinct (" + \
-                      str(muni_total) + ") for " + cand + " in " + \
-                      county_name + " County."
+    mismatches = reconcile_votes(cv, mv, ('county', 'candidate'), ['Gloucester'],
+                                 aliases.canonical_name, include_lower_only=False)
+    error_count = report_mismatches(mismatches, 'County', 'Precinct', args.verbose)
 
     print "There are " + str(error_count) + " vote totals that are not reconciled."
 
@@ -32,12 +32,14 @@ def main():
 
     CONST_COUNTY_FILE = '../2016/20161108__nj__general.csv'
     CONST_PRECINCT_FILE = '../2016/20161108__nj__general__ocean__precinct.csv'
+    CONST_ALIAS_FILE = 'aliases/2016_general_ocean.csv'
 
     args = handle_arguments()
     process_precinct_file(args, CONST_PRECINCT_FILE)
     compare_county_and_precinct_totals(args, 
                                    CONST_COUNTY_FILE,
-                                   CONST_PRECINCT_FILE)
+                                   CONST_PRECINCT_FILE,
+                                   CONST_ALIAS_FILE)
     #spot_check_totals(args, CONST_COUNTY_FILE)
 
 def handle_arguments():
@@ -51,87 +53,21 @@ def process_precinct_file(args, in_file):
     error_count = 0
 
     verifier = VerifyMuni(in_file, args.verbose, args.case)   
-    error_count += verifier.verify_counties()
-    error_count += verifier.verify_offices()
-    error_count += verifier.verify_districts()
-    error_count += verifier.verify_votes()
-    error_count += verifier.verify_candidate_party_relationship()
-    error_count += verifier.verify_candidate_office_relationship()
-    error_count += verifier.verify_candidate_district_relationship()
+    error_count += sum(verifier.verify_all().values())
 
     print 'There were ' + str(error_count) + ' invalid values in the Precinct File.'
 
     return
 
-def compare_county_and_precinct_totals(args, county_file, precinct_file):
-
-    error_count = 0
+def compare_county_and_precinct_totals(args, county_file, precinct_file, alias_file):
 
     cv = VerifyCounty(county_file, args.verbose, args.case)
     mv = VerifyPrecinct(precinct_file, args.verbose, args.case)
+    aliases = CandidateAliases(alias_file)
 
-    county_name = 'Ocean'
-    county_votes = cv.get_all_candidates_and_votes_by_county(county_name)
-    for cand in county_votes:
-        if cand == 'Hillary Rodham Clinton':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'Hillary Rodham CLINTON & Timothy Michael KAINE')
-        elif cand == 'Donald J. Trump':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'Donald J. TRUMP & Michael R. PENCE')
-        elif cand == 'Alyson Kennedy':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'Alyson KENNEDY & Osborne HART')
-        elif cand == 'Dan O\'Neill':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'Dan ONeill')
-        elif cand == 'Darrell Castle':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'Darrell CASTLE & Scott BRADLEY')
-        elif cand == 'Arthur T. Haussmann Jr.':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'Arthur T. Haussmann Junior')
-        elif cand == 'Rocky Roque De la Fuente':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'Rocky Roque De La FUENTE & Michael STEINBERG')
-        elif cand == 'Jill Stein':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'Jill STEIN & Ajamu BARAKA')
-        elif cand == 'Gloria La Riva':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'Gloria La RIVA & Eugene PURYEAR')
-        elif cand == 'Monica Moorehead':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'Monica MOOREHEAD & Lamont LILLY')
-        elif cand == 'Gary Johnson':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'Gary JOHNSON & William WELD')
-        elif cand == 'Frank A. LoBiondo':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'Frank A. LoBIONDO')
-        elif cand == 'David H. Cole':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'David H. COLE')
-        elif cand == 'James Keenan':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'James KEENAN')
-        elif cand == 'John Ordille':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'John ORDILLE')
-        elif cand == 'Gabriel Brian Franco':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'Gabriel Brian FRANCO')
-        elif cand == 'Eric Beechwood':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'Eric BEECHWOOD')
-        elif cand == 'Steven Fenichel':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'Steven FENICHEL')
-        elif cand == 'Tom MacArthur':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'Tom MacARTHUR')
-        elif cand == 'Frederick John LaVergne':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'Frederick John LaVERGNE')
-        elif cand == 'Lawrence W. Berlinski Jr.':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'Lawrence W. BERLINSKI JR')
-        elif cand == 'Christopher H. Smith':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'Christopher H. SMITH')
-        elif cand == 'Lorna Phillipson':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'Lorna PHILLIPSON')
-        elif cand == 'Hank Schroeder':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'Hank SCHROEDER')
-        elif cand == 'Jeremy Marcus':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'Jeremy MARCUS')
-        else:
-            muni_total = mv.get_candidates_votes_by_county(county_name, cand)
-        if muni_total != county_votes[cand]:
-            error_count += 1
-            if args.verbose:
-                print "Total votes are different in County (" + \
-                      str(county_votes[cand]) + ") and Precinct (" + \
-                      str(muni_total) + ") for " + cand + " in " + \
-                      county_name + " County."
+    mismatches = reconcile_votes(cv, mv, ('county', 'candidate'), ['Ocean'],
+                                 aliases.canonical_name, include_lower_only=False)
+    error_count = report_mismatches(mismatches, 'County', 'Precinct', args.verbose)
 
     print "There are " + str(error_count) + " vote totals that are not reconciled."
 
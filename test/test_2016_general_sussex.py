@@ -32,12 +32,14 @@ def main():
 
     CONST_COUNTY_FILE = '../2016/20161108__nj__general.csv'
     CONST_PRECINCT_FILE = '../2016/20161108__nj__general__sussex__precinct.csv'
+    CONST_ALIAS_FILE = 'aliases/2016_general_sussex.csv'
 
     args = handle_arguments()
     process_precinct_file(args, CONST_PRECINCT_FILE)
     compare_county_and_precinct_totals(args, 
                                    CONST_COUNTY_FILE,
-                                   CONST_PRECINCT_FILE)
+                                   CONST_PRECINCT_FILE,
+                                   CONST_ALIAS_FILE)
     #spot_check_totals(args, CONST_COUNTY_FILE)
 
 def handle_arguments():
@@ -51,59 +53,21 @@ def process_precinct_file(args, in_file):
     error_count = 0
 
     verifier = VerifyMuni(in_file, args.verbose, args.case)   
-    error_count += verifier.verify_counties()
-    error_count += verifier.verify_offices()
-    error_count += verifier.verify_districts()
-    error_count += verifier.verify_votes()
-    error_count += verifier.verify_candidate_party_relationship()
-    error_count += verifier.verify_candidate_office_relationship()
-    error_count += verifier.verify_candidate_district_relationship()
+    error_count += sum(verifier.verify_all().values())
 
     print 'There were ' + str(error_count) + ' invalid values in the Precinct File.'
 
     return
 
-def compare_county_and_precinct_totals(args, county_file, precinct_file):
-
-    error_count = 0
+def compare_county_and_precinct_totals(args, county_file, precinct_file, alias_file):
 
     cv = VerifyCounty(county_file, args.verbose, args.case)
     mv = VerifyPrecinct(precinct_file, args.verbose, args.case)
+    aliases = CandidateAliases(alias_file)
 
-    county_name = 'Sussex'
-    county_votes = cv.get_all_candidates_and_votes_by_county(county_name)
-    for cand in county_votes:
-        if cand == 'Hillary Rodham Clinton':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'Clinton / Kaine')
-        elif cand == 'Donald J. Trump':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'Trump / Pence')
-        elif cand == 'Alyson Kennedy':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'Kennedy / Hart')
-        elif cand == 'Dan O\'Neill':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'Dan ONeill')
-        elif cand == 'Darrell Castle':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'Castle / Bradley')
-        elif cand == 'Arthur T. Haussmann Jr.':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'Arthur T. Haussmann Junior')
-        elif cand == 'Rocky Roque De la Fuente':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'De La Fuente / Steinberg')
-        elif cand == 'Jill Stein':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'Stein / Baraka')
-        elif cand == 'Gloria La Riva':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'La Riva / Puryear')
-        elif cand == 'Monica Moorehead':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'Moorehead / Lilly')
-        elif cand == 'Gary Johnson':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'Johnson / Weld')
-        else:
-            muni_total = mv.get_candidates_votes_by_county(county_name, cand)
-        if muni_total != county_votes[cand]:
-            error_count += 1
-            if args.verbose:
-                print "Total votes are different in County (" + \
-                      str(county_votes[cand]) + ") and Precinct (" + \
-                      str(muni_total) + ") for " + cand + " in " + \
-                      county_name + " County."
+    mismatches = reconcile_votes(cv, mv, ('county', 'candidate'), ['Sussex'],
+                                 aliases.canonical_name, include_lower_only=False)
+    error_count = report_mismatches(mismatches, 'County', 'Precinct', args.verbose)
 
     print "There are " + str(error_count) + " vote totals that are not reconciled."
 
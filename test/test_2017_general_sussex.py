@@ -31,12 +31,14 @@ def main():
 
     CONST_COUNTY_FILE = '../2017/20171107__nj__general__county.csv'
     CONST_PRECINCT_FILE = '../2017/20171107__nj__general__sussex__precinct.csv'
+    CONST_ALIAS_FILE = 'aliases/2017_general_sussex.csv'
 
     args = handle_arguments()
     process_precinct_file(args, CONST_PRECINCT_FILE)
     compare_county_and_precinct_totals(args, 
                                    CONST_COUNTY_FILE,
-                                   CONST_PRECINCT_FILE)
+                                   CONST_PRECINCT_FILE,
+                                   CONST_ALIAS_FILE)
     #spot_check_totals(args, CONST_COUNTY_FILE)
 
 def handle_arguments():
@@ -50,53 +52,21 @@ def process_precinct_file(args, in_file):
     error_count = 0
 
     verifier = VerifyMuni(in_file, args.verbose, args.case)   
-    error_count += verifier.verify_counties()
-    error_count += verifier.verify_offices()
-    error_count += verifier.verify_districts()
-    error_count += verifier.verify_votes()
-    #error_count += verifier.verify_candidate_party_relationship()
-    #error_count += verifier.verify_candidate_office_relationship()
-    #error_count += verifier.verify_candidate_district_relationship()
+    error_count += sum(verifier.verify_all(['counties', 'offices', 'districts', 'votes']).values())
 
     print 'There were ' + str(error_count) + ' invalid values in the Precinct File.'
 
     return
 
-def compare_county_and_precinct_totals(args, county_file, precinct_file):
-
-    error_count = 0
+def compare_county_and_precinct_totals(args, county_file, precinct_file, alias_file):
 
     cv = VerifyCounty(county_file, args.verbose, args.case)
     mv = VerifyPrecinct(precinct_file, args.verbose, args.case)
+    aliases = CandidateAliases(alias_file)
 
-    county_name = 'Sussex'
-    county_votes = cv.get_all_candidates_and_votes_by_county(county_name)
-    for cand in county_votes:
-        if cand == 'Philip Murphy - Shelia Oliver':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'Murphy / Oliver')
-        elif cand == 'Kim Guadagno - Carlos A. Rendo':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'Guadagno / Rendo')
-        elif cand == 'Gina Genovese - Lt. Governor Not Filed':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'Genovese / No Petition Filed')
-        elif cand == 'Peter J. Rohrman - Karese J. Laguerre':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'Rohrman / Laguerre')
-        elif cand == 'Seth Kaper-Dale - Lisa Durden':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'Kaper-Dale / Durden')
-        elif cand == 'Matthew Riccardi - Lt. Governor Not Filed':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'Riccardi / No Petition Filed')
-        elif cand == 'Vincent Ross - April A. Johnson':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'Ross / Johnson')
-        elif cand == 'Thomas H. Kean Jr.':
-            muni_total = mv.get_candidates_votes_by_county(county_name, 'Thomas H. Kean, Jr.')
-        else:
-            muni_total = mv.get_candidates_votes_by_county(county_name, cand)
-        if muni_total != county_votes[cand]:
-            error_count += 1
-            if args.verbose:
-                print "Total votes are different in County (" + \
-                      str(county_votes[cand]) + ") and Precinct (" + \
-                      str(muni_total) + ") for " + cand + " in " + \
-                      county_name + " County."
+    mismatches = reconcile_votes(cv, mv, ('county', 'candidate'), ['Sussex'],
+                                 aliases.canonical_name, include_lower_only=False)
+    error_count = report_mismatches(mismatches, 'County', 'Precinct', args.verbose)
 
     print "There are " + str(error_count) + " vote totals that are not reconciled."
 
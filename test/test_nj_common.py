@@ -0,0 +1,104 @@
+#!/usr/bin/python
+#
+# MIT License
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+
+# Unit tests for nj_common. Run from this directory with
+#   python test_nj_common.py
+
+import os
+import shutil
+import tempfile
+import unittest
+from nj_common import *
+
+# Writes small results files to a temporary directory.
+class ResultsFileTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def write_file(self, file_name, rows):
+        path = os.path.join(self.directory, file_name)
+        with open(path, 'wb') as out_file:
+            writer = csv.writer(out_file)
+            for row in rows:
+                writer.writerow(row)
+        return path
+
+class GroupVotesTest(ResultsFileTest):
+
+    def test_missing_key_column(self):
+        county_file = self.write_file('20141104__nj__general.csv',
+                                      [('county', 'office', 'district', 'party', 'candidate', 'votes'),
+                                       ('Atlantic', 'U.S. Senate', '', 'Democratic', 'Cory Booker', '100')])
+        verifier = VerifyCounty(county_file, False, False)
+        with self.assertRaises(ValueError) as context:
+            verifier.group_votes(('county', 'municipality', 'candidate'))
+        self.assertIn('municipality', str(context.exception))
+        self.assertIn(county_file, str(context.exception))
+
+    def test_present_key_columns(self):
+        muni_file = self.write_file('20141104__nj__general__municipal.csv',
+                                    [('county', 'municipality', 'office', 'district', 'party', 'candidate', 'votes'),
+                                     ('Atlantic', 'Absecon', 'U.S. Senate', '', 'Democratic', 'Cory Booker', '100'),
+                                     ('Atlantic', 'Brigantine', 'U.S. Senate', '', 'Democratic', 'Cory Booker', '50')])
+        verifier = VerifyMuni(muni_file, False, False)
+        self.assertEqual(dict(verifier.group_votes(('county', 'municipality', 'candidate'))),
+                         { ('Atlantic', 'Absecon', 'Cory Booker'): 100,
+                           ('Atlantic', 'Brigantine', 'Cory Booker'): 50 })
+
+class ReconcileVotesTest(ResultsFileTest):
+
+    def test_mismatch_label_keeps_county_spelling(self):
+        county_file = self.write_file('20171107__nj__general.csv',
+                                      [('county', 'office', 'district', 'party', 'candidate', 'votes'),
+                                       ('Essex', 'Governor', '', 'Democratic', 'Philip Murphy - Shelia Oliver', '100')])
+        precinct_file = self.write_file('20171107__nj__general__essex__precinct.csv',
+                                        [('county', 'precinct', 'office', 'district', 'party', 'candidate', 'votes'),
+                                         ('Essex', 'Belleville 1', 'Governor', '', 'Democratic', 'PHILIP MURPHY - SHELIA OLIVER', '90')])
+        aliases = CandidateAliases()
+        mismatches = reconcile_votes(VerifyCounty(county_file, False, False), VerifyPrecinct(precinct_file, False, False),
+                                     ('county', 'candidate'), ['Essex'], aliases.canonical_name)
+        self.assertEqual(len(mismatches), 1)
+        self.assertEqual(mismatches[0].key, ('Essex', 'philip murphy - shelia oliver'))
+        self.assertEqual(mismatches[0].label, ('Essex', 'Philip Murphy - Shelia Oliver'))
+        self.assertEqual(mismatches[0].delta, -10)
+
+class ValidationReportTest(ResultsFileTest):
+
+    def test_profile_header_only_file(self):
+        county_file = self.write_file('20171107__nj__general.csv',
+                                      [('county', 'office', 'district', 'party', 'candidate', 'votes')])
+        report = ValidationReport(True)
+        results = VerifyCounty(county_file, False, False).verify_all(report=report)
+        self.assertEqual(sum(results.values()), 0)
+        entry = report.files[0]
+        self.assertEqual(entry['rows'], 0)
+        for check_name in entry['checks']:
+            self.assertEqual(entry['checks'][check_name]['profile'], [])
+
+if __name__ == '__main__':
+    unittest.main()
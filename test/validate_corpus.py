@@ -0,0 +1,134 @@
+#!/usr/bin/python
+#
+# MIT License
+#
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+
+import sys
+import os
+import argparse
+import multiprocessing
+from collections import OrderedDict
+from nj_common import *
+
+CONST_LEVEL_VERIFIERS = { 'county': VerifyCounty,
+                          'municipal': VerifyMuni,
+                          'precinct': VerifyPrecinct }
+
+def main():
+
+    args = handle_arguments()
+    cache = None
+    if not args.no_cache:
+        cache = ValidationCache(args.cache_file)
+
+    tasks = []
+    for results_file in find_results_files(args.root):
+        election, county_name, level = parse_results_file_name(results_file)
+        tasks.append((results_file, level, args.verbose, args.case, cache, args.report is not None, args.profile))
+
+    # Hand out the largest files first so no worker is left holding a big
+    # file after the others have finished.
+    tasks.sort(key=lambda task: os.path.getsize(task[0]), reverse=True)
+
+    pool = multiprocessing.Pool(args.jobs)
+    reports = pool.map(validate_file, tasks, 1)
+    pool.close()
+    pool.join()
+
+    if cache is not None:
+        for report in reports:
+            cache.merge(report[4])
+        cache.save()
+
+    if args.report is not None:
+        report = ValidationReport(args.profile)
+        for task_report in reports:
+            report.merge(task_report[5])
+        report.save(args.report)
+
+    print_reports(sorted(reports))
+
+def handle_arguments():
+    arg_parser = argparse.ArgumentParser(description='Validate every New Jersey results file in the repository')
+    arg_parser.add_argument('--verbose', '-v', dest='verbose',  help='report information verbosely', action='store_true')
+    arg_parser.add_argument('--case', '-c', dest='case',  help='case sensitive text compare', action='store_true')
+    arg_parser.add_argument('--jobs', '-j', dest='jobs', type=int, default=multiprocessing.cpu_count(), help='number of worker processes')
+    arg_parser.add_argument('--root', '-r', dest='root', default='..', help='directory holding the year directories')
+    arg_parser.add_argument('--cache-file', dest='cache_file', default='.validation_cache.json', help='where to remember files that passed')
+    arg_parser.add_argument('--no-cache', dest='no_cache', help='check every file even if it passed before', action='store_true')
+    arg_parser.add_argument('--report', dest='report', help='write a JSON report with counts and timings of every check')
+    arg_parser.add_argument('--profile', dest='profile', help='profile every check and add the results to the report', action='store_true')
+    args = arg_parser.parse_args()
+    if args.profile and args.report is None:
+        arg_parser.error('--profile needs --report')
+    return args
+
+# Runs in a worker process. Returns (file, level, check results, failure
+# message, new cache entries, report entries); a file that cannot be checked
+# reports its failure instead. The worker's copy of the cache is only read
+# from, new clean results are handed back to be merged into the saved cache.
+def validate_file(task):
+    results_file, level, verbose, case, cache, reporting, profile = task
+    report = None
+    if reporting:
+        report = ValidationReport(profile)
+    try:
+        verifier = CONST_LEVEL_VERIFIERS[level](results_file, verbose, case)
+        results = verifier.verify_all(cache=cache, report=report)
+    except Exception as e:
+        return (results_file, level, None, str(e), {}, [])
+    finally:
+        parsed_files.release(results_file)
+    new_entries = {}
+    if cache is not None:
+        new_entries = cache.added_entries
+    report_entries = []
+    if report is not None:
+        report_entries = report.files
+    return (results_file, level, results, None, new_entries, report_entries)
+
+def print_reports(reports):
+
+    error_count = 0
+    failed_count = 0
+    check_totals = OrderedDict()
+
+    for results_file, level, results, failure, new_entries, report_entries in reports:
+        if results is None:
+            failed_count += 1
+            print results_file + ' (' + level + '): could not be checked: ' + failure
+            continue
+        file_errors = sum(results.values())
+        error_count += file_errors
+        for check_name in results:
+            check_totals[check_name] = check_totals.get(check_name, 0) + results[check_name]
+        print results_file + ' (' + level + '): ' + str(file_errors) + ' invalid values ' + \
+              '(' + ', '.join(name + '=' + str(results[name]) for name in results) + ')'
+
+    print ''
+    for check_name in check_totals:
+        print '  ' + check_name + ': ' + str(check_totals[check_name])
+    print 'There were ' + str(error_count) + ' invalid values in ' + str(len(reports)) + ' files.'
+    if failed_count > 0:
+        print 'There were ' + str(failed_count) + ' files that could not be checked.'
+
+if __name__ == '__main__':
+    main()